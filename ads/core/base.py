@@ -1,8 +1,12 @@
 import logging
 from abc import ABC
+from typing import Dict
 
 from ads.helpers.helper_library import HelperLibrary
 
+# Module-aware loggers per class, skips logging.getLogger's module lock on every instantiation
+_LOGGER_CACHE: Dict[type, logging.Logger] = {}
+
 
 class AdsBase(ABC):
     """
@@ -11,12 +15,20 @@ class AdsBase(ABC):
     Provides:
         - preconfigured module-aware logger via `self.logger`
         - potential future hooks (timing, telemetry, etc.)
+
+    Declares empty __slots__ so that subclasses can opt into slotted instances
+    (it is also combined with pydantic.BaseModel and ValueError, which rules out
+    non-empty slots here).
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._logger = logging.getLogger(self.__class__.__module__)
-        self._helpers = HelperLibrary()
+        cls = self.__class__
+        self._logger = _LOGGER_CACHE.get(cls) or _LOGGER_CACHE.setdefault(cls, logging.getLogger(cls.__module__))
+        # Helpers are stateless (only module-level caches), every component shares the process-wide instance
+        self._helpers = HelperLibrary.global_instance()
 
     @property
     def logger(self) -> logging.Logger:
@@ -1,13 +1,81 @@
+import asyncio
+import concurrent.futures
+import functools
+import importlib.util
+import threading
 import time
-from typing import Optional, Tuple, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Tuple, List, Dict, Any, Iterator
 
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
+from requests.adapters import HTTPAdapter
 
 from ads.core.base import AdsBase
 from ads.core.enums import SuiteRunStatus
 from ads.core.models import ResultsMetadata, Suite
 from ads.helpers.helper_library import HelperLibrary
 
+# pyarrow (and google-cloud-bigquery-storage) are optional, install with 'argos-data-sentinel[arrow]'
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Suite run statuses bound once (module globals instead of Enum class attribute lookups)
+_ST_SUCCESS = SuiteRunStatus.SUCCESS
+_ST_FAILED = SuiteRunStatus.FAILED
+_ST_VALIDATION_SUCCESS = SuiteRunStatus.VALIDATION_SUCCESS
+_ST_VALIDATION_FAILED = SuiteRunStatus.VALIDATION_FAILED
+
+# Template configuration for executed queries. A copy is passed per query, since QueryJob may keep
+# a reference to the configuration's properties (copying from the API representation is cheap).
+# Priority is left unset: jobs.query runs INTERACTIVE by default and its request has no `priority` field
+_DEFAULT_JOB_CONFIG = bigquery.QueryJobConfig(use_query_cache=True,
+                                              use_legacy_sql=False)
+
+# Successful dry-run results are reused for identical queries within the TTL
+DRY_RUN_CACHE_TTL_SECONDS = 300
+DRY_RUN_CACHE_MAX_SIZE = 1000
+_DRY_RUN_CACHE: "OrderedDict[Tuple[str, Optional[str], str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_DRY_RUN_CACHE_LOCK = threading.Lock()
+
+# Number of keep-alive HTTPS connections kept open to bigquery.googleapis.com per client
+HTTP_POOL_SIZE = 16
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_credentials() -> Any:
+    """Resolves the Application Default Credentials once per process, shared by the BigQuery and Storage clients."""
+    credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+    return credentials
+
+
+@functools.lru_cache(maxsize=None)
+def get_bigquery_client(project_id: str, location: Optional[str] = None) -> bigquery.Client:
+    """
+    Returns a process-wide BigQuery client per (project_id, location).
+
+    Credential discovery and HTTPS session setup happen once, and the underlying
+    connection pool keeps TLS sessions alive across queries and Executor instances.
+    """
+    credentials = _get_default_credentials()
+    session = AuthorizedSession(credentials)
+    session.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+    return bigquery.Client(project=project_id, location=location, credentials=credentials, _http=session)
+
+
+@functools.lru_cache(maxsize=None)
+def get_bqstorage_client() -> Optional[Any]:
+    """
+    Returns the process-wide BigQuery Storage Read API client (None when the storage package is missing).
+
+    Creating one opens a gRPC channel, so it is shared like the BigQuery client itself.
+    """
+    try:
+        from google.cloud import bigquery_storage
+    except ImportError:
+        return None
+    return bigquery_storage.BigQueryReadClient(credentials=_get_default_credentials())
+
 
 class Executor(AdsBase):
     """
@@ -28,21 +96,30 @@ class Executor(AdsBase):
         rows, metrics = executor.execute(compiled_sql)
     """
 
+    __slots__ = ("_logger", "_helpers", "_project_id", "_location", "_client")
+
+    # Maximum number of BigQuery jobs running concurrently in execute_many
+    MAX_CONCURRENT_QUERIES = 10
+
+    # Results larger than this are decoded in bulk via Arrow (BigQuery Storage Read API has a setup cost)
+    ARROW_ROW_THRESHOLD = 1000
+
+    # Client-side wait limit for a query job in seconds (None waits until the job finishes),
+    # jobs exceeding it are cancelled and reported as FAILED
+    QUERY_TIMEOUT_SECONDS: Optional[float] = None
+
     def __init__(self,
                  project_id: str,
                  helpers: HelperLibrary,
                  location: Optional[str] = None):
         """Initializes a BigQuery client and basic execution settings"""
+        super().__init__()
         self._project_id = project_id
         self._location = location
         self._helpers = helpers
         self._client: Optional[bigquery.Client] = None
 
     # region Properties
-    @property
-    def helpers(self) -> HelperLibrary:
-        return self._helpers
-
     @property
     def project_id(self) -> str:
         return self._project_id
@@ -53,28 +130,34 @@ class Executor(AdsBase):
     # endregion
 
     def _connect(self) -> bigquery.Client:
-        """Creates and caches a BigQuery client"""
+        """Returns the shared BigQuery client for this project and location"""
         if not self._client:
-            self._client = bigquery.Client(project=self.project_id, location=self.location)
+            self._client = get_bigquery_client(project_id=self.project_id, location=self.location)
         return self._client
 
     def execute(self,
                 suite: Suite,
                 sql_query: str,
-                flatten_results: Optional[bool] = False,
-                validate_first: Optional[bool] = True,
-                validate_only: Optional[bool] = False,
-                extra: Optional[Dict[str, Any]] = None) -> Tuple[ResultsMetadata, List[Dict[str, Any]]]:
+                flatten_results: bool = False,
+                validate_first: bool = True,
+                validate_only: bool = False,
+                extra: Optional[Dict[str, Any]] = None) -> Tuple[ResultsMetadata, Iterator[Dict[str, Any]]]:
         """
         Executes the given SQL statement in BigQuery
 
+        Rows are streamed: only the current page (or Arrow record batch) is held as
+        Python dicts. Wrap with list(...) when the rows are needed more than once.
+        A page fetch failing while the rows are consumed marks the metadata FAILED, and
+        ended_at/duration_ms are final once the rows are exhausted.
+
         Returns:
-            - rows: List of result rows (as dicts)
+            - rows: Iterator of result rows (as dicts)
             - metadata: Dict wit execution info (job_id, duration, bytes_processed, etc.)
         """
 
         # region Initialize connection and prepare base metadata
         client = self._connect()
+        started_counter = time.perf_counter()
         metadata: ResultsMetadata = ResultsMetadata(
             suite_name=suite.name,
             suite_description=suite.description,
@@ -85,43 +168,51 @@ class Executor(AdsBase):
         )
         # endregion
 
-        # region Prepare and execute dry_run
-        if validate_only or validate_first:
+        # region Prepare and execute dry_run (ONLY when validate_only, otherwise errors are caught while executing)
+        if validate_only:
             try:
-                dry_job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
-                dry_job = client.query(query=sql_query, job_config=dry_job_config)
-                metadata.job_id = dry_job.job_id
-                metadata.bytes_processed = dry_job.total_bytes_processed
-                metadata.cache_hit = dry_job.cache_hit
-                metadata.status = SuiteRunStatus.VALIDATION_SUCCESS
+                dry_run_stats = self.dry_run(sql_query=sql_query)
+                # A reused dry-run belongs to an earlier run, its job is not reported as this run's job
+                if dry_run_stats["cached"]:
+                    metadata.extra = {**(metadata.extra or {}), "dry_run_cached": True}
+                else:
+                    metadata.job_id = dry_run_stats["job_id"]
+                metadata.bytes_processed = dry_run_stats["bytes_processed"]
+                metadata.cache_hit = dry_run_stats["cache_hit"]
+                metadata.status = _ST_VALIDATION_SUCCESS
             except Exception as e:
-                metadata.status = SuiteRunStatus.VALIDATION_FAILED
+                metadata.status = _ST_VALIDATION_FAILED
                 metadata.errors = [str(e)]
-                return metadata, []
-
-            if validate_only:
-                return metadata, []
+            self._set_ended_at(metadata=metadata, started_counter=started_counter)
+            return metadata, iter(())
         # endregion
 
         # region Execute Query
-        job_config = bigquery.QueryJobConfig
-        rows: List[Dict[str, Any]] = []
+        job_config = bigquery.QueryJobConfig.from_api_repr(_DEFAULT_JOB_CONFIG.to_api_repr())
+        job = None
         try:
 
-            # region Execute actual query and return results
-            job = client.query(query=sql_query, job_config=job_config)
-            result = job.result()
+            # region Execute actual query (jobs.query fast path, first page of rows returned inline) and return results
+            job = client.query(query=sql_query, job_config=job_config, api_method=bigquery.enums.QueryApiMethod.QUERY)
+            result = job.result(timeout=self.QUERY_TIMEOUT_SECONDS)
 
             metadata.job_id = job.job_id
             metadata.bytes_processed = job.total_bytes_processed
             metadata.cache_hit = job.cache_hit
-            metadata.status = SuiteRunStatus.SUCCESS
+            metadata.status = _ST_SUCCESS
 
-            rows = self._to_dict_rows(result=result, flatten=flatten_results)
+            rows = self._iter_dict_rows(result=result, flatten=flatten_results)
             # endregion
 
         except Exception as e:
 
+            # A timed out job keeps running (and billing) in BigQuery unless it is cancelled
+            if job is not None and isinstance(e, concurrent.futures.TimeoutError):
+                try:
+                    job.cancel()
+                except Exception:
+                    pass
+
             # region Get errors if exist
             errors = []
             try:
@@ -132,22 +223,150 @@ class Executor(AdsBase):
 
             # region Update metadata and return result
             metadata.job_id = getattr(job, "job_id", None)
-            metadata.status = SuiteRunStatus.FAILED
-            metadata.errors = [str(e) + errors]
+            metadata.status = _ST_FAILED
+            metadata.errors = [str(e), *errors]
+            self._set_ended_at(metadata=metadata, started_counter=started_counter)
+            return metadata, iter(())
             # endregion
 
-        finally:
-            metadata.ended_at = time.time()
-            metadata.duration_ms = round((metadata.ended_at - metadata.started_at) * 1000, 2)
-            return metadata, rows
+        self._set_ended_at(metadata=metadata, started_counter=started_counter)
+        return metadata, self._track_rows(rows=rows, metadata=metadata, started_counter=started_counter)
         # endregion
 
+    def dry_run(self, sql_query: str) -> Dict[str, Any]:
+        """
+        Validates the given SQL statement with a BigQuery dry-run (raises on invalid SQL)
+
+        Successful dry-runs of the same statement are reused within DRY_RUN_CACHE_TTL_SECONDS.
+        Safe to call from several threads, they share one BigQuery client.
+
+        Returns:
+            - Dict with the dry-run job_id, bytes_processed, cache_hit and cached
+              (True when the statistics were reused, job_id is then the earlier dry-run's job)
+        """
+        dry_run_key = (self.project_id, self.location, sql_query)
+        dry_run_stats = self._get_cached_dry_run(key=dry_run_key)
+        if dry_run_stats is not None:
+            return {**dry_run_stats, "cached": True}
+
+        dry_job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+        dry_job = self._connect().query(query=sql_query, job_config=dry_job_config)
+        dry_run_stats = dict(job_id=dry_job.job_id,
+                             bytes_processed=dry_job.total_bytes_processed,
+                             cache_hit=dry_job.cache_hit)
+        self._cache_dry_run(key=dry_run_key, stats=dry_run_stats)
+        return {**dry_run_stats, "cached": False}
+
+    async def execute_async(self,
+                            suite: Suite,
+                            sql_query: str,
+                            flatten_results: bool = False,
+                            validate_first: bool = True,
+                            validate_only: bool = False,
+                            extra: Optional[Dict[str, Any]] = None) -> Tuple[ResultsMetadata, List[Dict[str, Any]]]:
+        """
+        Executes the given SQL statement in a worker thread, so that several jobs can be awaited concurrently.
+        Rows are fetched within the worker thread as well and returned as a list.
+        """
+
+        def _execute_and_fetch() -> Tuple[ResultsMetadata, List[Dict[str, Any]]]:
+            metadata, rows = self.execute(suite=suite,
+                                          sql_query=sql_query,
+                                          flatten_results=flatten_results,
+                                          validate_first=validate_first,
+                                          validate_only=validate_only,
+                                          extra=extra)
+            return metadata, list(rows)
+
+        return await asyncio.to_thread(_execute_and_fetch)
+
+    def execute_many(self,
+                     queries: List[Tuple[Suite, str]],
+                     flatten_results: bool = False,
+                     validate_first: bool = True,
+                     validate_only: bool = False,
+                     extra: Optional[Dict[str, Any]] = None,
+                     max_concurrency: Optional[int] = None) -> List[Tuple[ResultsMetadata, List[Dict[str, Any]]]]:
+        """
+        Executes several (suite, sql_query) pairs concurrently in BigQuery
+
+        At most `max_concurrency` (default MAX_CONCURRENT_QUERIES) jobs run at the same time.
+        Must not be called from within a running event loop, await `execute_async` there instead.
+
+        Returns:
+            - List of (metadata, rows) tuples, in the same order as `queries`
+        """
+        semaphore_size = max_concurrency or self.MAX_CONCURRENT_QUERIES
+
+        async def _execute_all() -> List[Tuple[ResultsMetadata, List[Dict[str, Any]]]]:
+            semaphore = asyncio.Semaphore(semaphore_size)
+
+            async def _execute_one(suite: Suite, sql_query: str) -> Tuple[ResultsMetadata, List[Dict[str, Any]]]:
+                async with semaphore:
+                    return await self.execute_async(suite=suite,
+                                                    sql_query=sql_query,
+                                                    flatten_results=flatten_results,
+                                                    validate_first=validate_first,
+                                                    validate_only=validate_only,
+                                                    extra=extra)
+
+            return list(await asyncio.gather(*(_execute_one(suite, sql_query) for suite, sql_query in queries)))
+
+        return asyncio.run(_execute_all())
+
+    def _get_cached_dry_run(self, key: Tuple[str, Optional[str], str]) -> Optional[Dict[str, Any]]:
+        """Returns the statistics of a successful dry-run of the same query within the TTL, if any"""
+        with _DRY_RUN_CACHE_LOCK:
+            cached = _DRY_RUN_CACHE.get(key)
+            if cached is None:
+                return None
+            cached_at, stats = cached
+            if time.monotonic() - cached_at > DRY_RUN_CACHE_TTL_SECONDS:
+                del _DRY_RUN_CACHE[key]
+                return None
+            return stats
+
+    def _cache_dry_run(self, key: Tuple[str, Optional[str], str], stats: Dict[str, Any]) -> None:
+        """Caches the statistics of a successful dry-run, evicting the oldest entries above the max size"""
+        with _DRY_RUN_CACHE_LOCK:
+            _DRY_RUN_CACHE[key] = (time.monotonic(), stats)
+            _DRY_RUN_CACHE.move_to_end(key)
+            while len(_DRY_RUN_CACHE) > DRY_RUN_CACHE_MAX_SIZE:
+                _DRY_RUN_CACHE.popitem(last=False)
+
+    def _track_rows(self,
+                    rows: Iterator[Dict[str, Any]],
+                    metadata: ResultsMetadata,
+                    started_counter: float) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the rows while keeping the run metadata accurate for the lazy fetch
+
+        Remaining pages (or Arrow batches) are fetched while the rows are consumed, so a failing fetch
+        marks the run FAILED (the rows stop there, as with a failed query) and the end timestamp
+        and duration are updated once the rows are exhausted to include the fetch time.
+        """
+        try:
+            yield from rows
+        except Exception as e:
+            metadata.status = _ST_FAILED
+            metadata.errors = [*(metadata.errors or []), str(e)]
+        finally:
+            self._set_ended_at(metadata=metadata, started_counter=started_counter)
+
+    def _set_ended_at(self, metadata: ResultsMetadata, started_counter: float) -> None:
+        """Sets the wall-clock end timestamp and the duration (measured with the monotonic perf counter)"""
+        metadata.ended_at = time.time()
+        metadata.duration_ms = round((time.perf_counter() - started_counter) * 1000, 2)
+
     def _flatten_rows(self,
                       data: Dict[str, Any],
                       parent_key: Optional[str] = "",
                       seperator: Optional[str] = ".") -> Dict[str, Any]:
         """
-        Recursively flattens a nested dictionary (and lists) into a flat dict.
+        Flattens a nested dictionary (and lists) into a flat dict.
+
+        Uses an explicit stack of iterators instead of recursion, so deeply nested
+        rows neither pay per-level frame overhead nor hit the recursion limit.
 
         Examples:
             Input:
@@ -156,37 +375,56 @@ class Executor(AdsBase):
                 {"a.b.c": 1, "d[0]": 10, "d[1]": 20}
         """
 
-        items = []
-
-        for key, value in data.items():
-            flatten_key = f"{parent_key}{seperator}{key}" if parent_key else key
-
-            if isinstance(value, dict):
-                items.extend(self._flatten_rows(data=value,
-                                                parent_key=key,
-                                                seperator=seperator))
-            elif isinstance(value, list):
-                for idx, val in enumerate(value):
-                    if isinstance(val, dict):
-                        items.extend(self._flatten_rows(data=val,
-                                                        parent_key=f"{flatten_key}[{idx}]",
-                                                        seperator=seperator))
-                    else:
-                        items.append((f"{flatten_key}[{idx}]", val))
-
+        flat_row: Dict[str, Any] = {}
+        stack = [(iter(data.items()), parent_key, False)]
+
+        while stack:
+            items, prefix, is_list = stack[-1]
+            for key, value in items:
+                if is_list:
+                    flatten_key = f"{prefix}[{key}]"
+                else:
+                    flatten_key = f"{prefix}{seperator}{key}" if prefix else key
+
+                if isinstance(value, dict):
+                    stack.append((iter(value.items()), flatten_key, False))
+                    break
+                if isinstance(value, list) and not is_list:
+                    stack.append((iter(enumerate(value)), flatten_key, True))
+                    break
+                flat_row[flatten_key] = value
             else:
-                items.append((flatten_key, value))
+                stack.pop()
 
-        return dict(items)
+        return flat_row
 
-    def _to_dict_rows(self,
-                      result: bigquery.table.RowIterator,
-                      flatten: Optional[bool] = False) -> List[Dict[str, Any]]:
-        """Converts BigQuery RowIterator to list of dictionaries"""
-        rows = []
-        for row in result:
-            row_dict = dict(row.items())
+    def _iter_dict_rows(self,
+                        result: bigquery.table.RowIterator,
+                        flatten: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily converts BigQuery RowIterator to dictionaries
+
+        Large results (> ARROW_ROW_THRESHOLD rows) are decoded column-wise through Arrow when pyarrow
+        is installed, streamed and converted one record batch at a time. Smaller results are iterated page by page
+        so the first page (already returned inline by jobs.query) is consumed from cache and
+        getQueryResults is only called for the remaining pages.
+        """
+        flatten_rows = self._flatten_rows
+
+        if PYARROW_AVAILABLE and (result.total_rows or 0) > self.ARROW_ROW_THRESHOLD:
+            # Record batches are streamed from the Storage Read API, the full Arrow table is never materialized
+            bqstorage_client = get_bqstorage_client()
+            for batch in result.to_arrow_iterable(bqstorage_client=bqstorage_client):
+                batch_rows = batch.to_pylist()
+                if flatten:
+                    yield from (flatten_rows(data=row_dict) for row_dict in batch_rows)
+                else:
+                    yield from batch_rows
+            return
+
+        # dict(row) goes through Row.keys()/__getitem__, cheaper than building dict(row.items())
+        for page in result.pages:
             if flatten:
-                row_dict = self._flatten_rows(data=row_dict)
-            rows.append(row_dict)
-        return rows
\ No newline at end of file
+                yield from (flatten_rows(data=dict(row)) for row in page)
+            else:
+                yield from (dict(row) for row in page)
@@ -1,43 +1,65 @@
-import logging
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 from ads.core.base import AdsBase
+from ads.core.models import Suite, Result, ResultRow, CheckStatus, Check, Threshold
 
-logger = logging.getLogger(__name__)
 
+# Thresholds are immutable, so checks without one share a single empty (always passing) threshold
+_NO_THRESHOLD = Threshold()
 
-from typing import Any, Dict, List, Optional
-from ads.core.models import Suite, Result, CheckStatus, Check, Threshold
+_T = TypeVar("_T")
 
 
 class ResultParser(AdsBase):
     """
-    Parses raw BigQuery query results into structured Result objects.
+    Parses raw BigQuery query results into structured Result (or lightweight ResultRow) objects.
 
     Steps:
         1. Iterate through each row returned by the Executor.
         2. Match the check name with its definition in the Suite.
         3. Determine the check status (PASS / FAIL / ERROR) based on thresholds.
-        4. Create and return a list of Result objects with computed fields.
+        4. Create and return a list of Result (`parse`) or ResultRow (`parse_rows`) objects with computed fields.
 
     Example:
         parser = ResultParser()
-        results = parser.parse(rows, suite)
+        results = parser.parse(suite, rows)
     """
 
-    def parse(self, suite: Suite, rows: List[Dict[str, Any]]) -> List[Result]:
-        """Main entry point: converts raw rows into Result objects."""
-        parsed_results: List[Result] = []
+    __slots__ = ("_logger", "_helpers")
 
-        for row in rows:
-            check_name = row["check_name"]
-            check = self._get_check_by_name(suite=suite, check_name=check_name)
+    # Candidate value columns, in order of precedence
+    VALUE_KEYS = ("check_value", "value", "metric_value", "ratio", "count", "row_count")
+
+    def parse(self, suite: Suite, rows: Union[Iterable[Dict[str, Any]], Any]) -> List[Result]:
+        """Main entry point: converts raw rows (any iterable, consumed once) or an Arrow table into Result objects."""
+        return self._parse(suite=suite, rows=rows, factory=Result.from_trusted)
+
+    def parse_rows(self, suite: Suite, rows: Union[Iterable[Dict[str, Any]], Any]) -> List[ResultRow]:
+        """
+        Converts raw rows into slotted ResultRow objects (for consumers that do not need the pydantic model).
+
+        `rows` is either an iterable of dict rows (consumed once) or a columnar pyarrow Table/RecordBatch,
+        whose check name and value columns are read as two arrays instead of one dict per row.
+        """
+        return self._parse(suite=suite, rows=rows, factory=ResultRow)
+
+    def _parse(self, suite: Suite, rows: Union[Iterable[Dict[str, Any]], Any], factory: Callable[..., _T]) -> List[_T]:
+        """Evaluates each row against its check and builds one object per row with `factory` (a single construction per row)."""
+        parsed_results: List[_T] = []
+        checks_by_name = self._index_checks_by_name(suite=suite)
+        check_values = self._iter_arrow_values(rows) if hasattr(rows, "column_names") else self._iter_row_values(rows)
+
+        for row_check_name, raw_value in check_values:
+            check = checks_by_name.get(row_check_name)
 
             if not check:
-                self.logger.warning(f"ResultParser: No check found for '{check_name}' in suite '{suite.name}'")
+                self.logger.warning(f"ResultParser: No check found for '{row_check_name}' in suite '{suite.name}'")
                 continue
 
-            value = self._extract_value(row)
-            threshold: Threshold = check.threshold or Threshold()
+            # The (interned) name of the Check definition, not a per-row copy of the BigQuery string
+            check_name = check.name
+            value = None if raw_value is None else float(raw_value)
+            threshold: Threshold = check.threshold or _NO_THRESHOLD
 
             if value is None:
                 status = CheckStatus.ERROR
@@ -47,7 +69,8 @@ class ResultParser(AdsBase):
                 status = CheckStatus.PASS if is_passed else CheckStatus.FAIL
                 message = self._build_message(check_name=check_name, value=value, threshold=threshold, status=status)
 
-            result = Result(
+            # Every field below is produced and typed by the parser itself, no validation needed
+            result = factory(
                 check_name=check_name,
                 status=status,
                 message=message,
@@ -66,16 +89,29 @@ class ResultParser(AdsBase):
                 if status == CheckStatus.PASS
                 else f"{check_name}: value {value} outside {threshold.describe()}")
 
-    def _extract_value(self, row: Dict[str, Any]) -> Optional[float]:
-        """Extracts the primary numeric value (violations, ratio, etc.)."""
-        for key in ["check_value", "value", "metric_value", "ratio", "count", "row_count"]:
-            if key in row:
-                return float(row[key])
+    def _iter_row_values(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        """Yields (check name, raw value) pairs of dict rows."""
+        value_key: Optional[str] = None
+        for row in rows:
+            # All rows of one query share the same schema, so the value column is resolved once
+            if value_key is None or value_key not in row:
+                value_key = self._find_value_key(row)
+            yield row["check_name"], (row[value_key] if value_key is not None else None)
+
+    def _iter_arrow_values(self, table: Any) -> Iterator[Tuple[str, Any]]:
+        """Yields (check name, raw value) pairs of a pyarrow Table/RecordBatch, converting only the two columns used."""
+        check_names = table.column("check_name").to_pylist()
+        value_key = self._find_value_key(frozenset(table.column_names))
+        values = table.column(value_key).to_pylist() if value_key is not None else [None] * len(check_names)
+        return zip(check_names, values)
+
+    def _find_value_key(self, columns: Collection[str]) -> Optional[str]:
+        """Finds the column holding the primary numeric value (violations, ratio, etc.)."""
+        for key in self.VALUE_KEYS:
+            if key in columns:
+                return key
         return None
 
-    def _get_check_by_name(self, suite: Suite, check_name: str) -> Optional[Check]:
-        """Helper to fetch the matching Check definition from a Suite"""
-        for check in suite.checks:
-            if check.name == check_name:
-                return check
-        return None
+    def _index_checks_by_name(self, suite: Suite) -> Dict[str, Check]:
+        """Helper to index the Check definitions of a Suite by name (built once per parse)"""
+        return {check.name: check for check in suite.checks}
@@ -1,9 +1,13 @@
-from typing import List
+from itertools import chain
+from typing import Any, Dict, List, Tuple
 
 from ads.core.base import AdsBase
 from ads.core.models import Suite, Check, DataSourceType
 from ads.helpers.helper_library import HelperLibrary
 
+# Characters escaped inside a single-quoted BigQuery string literal
+_STRING_LITERAL_ESCAPE = str.maketrans({"\\": "\\\\", "'": "\\'", "\n": "\\n", "\r": "\\r"})
+
 
 class SQLBuilder(AdsBase):
     """
@@ -13,19 +17,34 @@ class SQLBuilder(AdsBase):
     This class transforms a Suite object into a single executable SQL query.
     It builds:
       - a base CTE from the suite's DataSource,
-      - a CTE per Check (referencing the base query as 'base'),
+      - one fused CTE computing all single-aggregate checks in one scan of the base CTE,
+      - a CTE per remaining Check (referencing the base query as 'base'),
       - and a final UNION ALL that merges all check results.
 
     Example output:
-        WITH base AS (...),
-             check_nulls AS (...),
-             check_positive_revenue AS (...)
-        SELECT * FROM check_nulls
+        WITH cte_<suite>_base AS (...),
+             cte_referential_check AS (...),
+             fused_<suite>_checks AS (...)
+        SELECT * FROM cte_referential_check
         UNION ALL
-        SELECT * FROM check_positive_revenue
+        SELECT * FROM fused_<suite>_checks
     """
 
+    __slots__ = ("_logger", "_helpers", "_suite")
+
+    # BigQuery rejects statements over 1024k characters, leaves headroom for suite-level param expansion
+    MAX_QUERY_LENGTH = 900_000
+    # Fixed statement scaffolding, shared by every build
+    _CTE_SEPARATOR = ", "
+    _SELECT_FROM = "SELECT * FROM "
+    UNION_SEPARATOR = "\nUNION ALL\n"
+    # Column carrying the suite name in `build_as_subquery` output
+    SUITE_NAME_COLUMN = "suite_name"
+    # Characters added per CTE besides its block and name
+    _UNION_OVERHEAD = len(_CTE_SEPARATOR) + len(_SELECT_FROM) + len(UNION_SEPARATOR)
+
     def __init__(self, suite: Suite, helpers: HelperLibrary):
+        super().__init__()
         self._suite = suite
         self._helpers = helpers
 
@@ -33,30 +52,107 @@ class SQLBuilder(AdsBase):
     def suite(self) -> Suite:
         return self._suite
 
-    @property
-    def helpers(self) -> HelperLibrary:
-        return self._helpers
-
     def build(self) -> str:
         """Main entrypoint: builds and returns the full SQL string."""
+        return self._assemble(base_cte=self._build_base_cte(), blocks=self._build_check_blocks())
+
+    def build_as_subquery(self) -> str:
+        """
+        Builds the suite as a single SELECT tagging every check row with the suite name (column `SUITE_NAME_COLUMN`).
+
+        Several suites built this way can be combined with UNION ALL into one job (see `SentinelRunner.run_suites`),
+        the WITH clause of each suite stays scoped to its own subquery.
+        """
+        return self.wrap_as_subquery(suite_name=self.suite.name, sql_query=self.build())
+
+    @classmethod
+    def wrap_as_subquery(cls, suite_name: str, sql_query: str) -> str:
+        """Wraps an already built suite statement as `build_as_subquery` does (the suite name is escaped as a string literal)."""
+        return (f"SELECT '{suite_name.translate(_STRING_LITERAL_ESCAPE)}' AS {cls.SUITE_NAME_COLUMN}, suite_checks.*\n"
+                f"FROM (\n{sql_query}\n) AS suite_checks")
+
+    def build_batches(self, max_query_length: int = MAX_QUERY_LENGTH) -> List[str]:
+        """
+        Builds the suite as few statements as possible, each one kept under `max_query_length` characters.
+
+        Suites normally compile into a single statement (one job, one scan of the base CTE).
+        Only suites whose unified SQL would exceed the limit are split into several UNION ALL
+        statements, each repeating the base CTE and carrying a subset of the check CTEs.
+        """
+        base_sql_block = self._build_base_cte()
+        batches: List[List[Tuple[str, str]]] = [[]]
+        batch_length = len(base_sql_block)
 
-        # region Prepare SQL body
+        for cte_name, cte_block in self._build_check_blocks():
+            block_length = len(cte_block) + len(cte_name) + self._UNION_OVERHEAD
+            if batches[-1] and batch_length + block_length > max_query_length:
+                batches.append([])
+                batch_length = len(base_sql_block)
+            batches[-1].append((cte_name, cte_block))
+            batch_length += block_length
+
+        return [self._assemble(base_cte=base_sql_block, blocks=batch) for batch in batches]
+
+    def build_check_statements(self) -> Dict[str, str]:
+        """
+        Builds one standalone statement per check (check name -> SQL), each with its own copy of the base CTE.
+
+        Meant for validating checks individually (e.g. parallel dry-runs), executing the suite uses `build`.
+        """
         base_sql_block = self._build_base_cte()
-        check_cte_blocks = [self._build_check_cte(check) for check in self.suite.checks]
-        raw_sql_body = self._combine_cte_blocks(base_cte=base_sql_block, check_ctes=check_cte_blocks)
-        sql_body = self.helpers.string.render_jinja_template(value=raw_sql_body,
-                                                             params=self.suite.params,
-                                                             keep_undefined_as_is=False)
+        statements: Dict[str, str] = {}
+        for check in self.suite.checks:
+            statements[check.name] = self._assemble(base_cte=base_sql_block,
+                                                    blocks=[(f"cte_{check.name}", self._build_check_cte(check))])
+        return statements
+
+    def _assemble(self, base_cte: str, blocks: List[Tuple[str, str]]) -> str:
+        """Combines the base CTE and the given (cte name, cte block) pairs into one statement selecting all check results."""
+
+        # region Prepare SQL body
+        sql_body = self._combine_cte_blocks(base_cte=base_cte, check_ctes=[cte_block for _, cte_block in blocks])
+
+        # Apply suite level Jinja templates once over the whole body (nothing to substitute without params)
+        if self.suite.params:
+            sql_body = self.helpers.string.render_jinja_template(value=sql_body,
+                                                                 params=self.suite.params,
+                                                                 keep_undefined_as_is=False)
         # endregion
 
         # region Union all checks
-        check_unions = "\nUNION ALL\n".join(
-            f"SELECT * FROM cte_{check.name}" for check in self.suite.checks
-        )
+        select_from = self._SELECT_FROM
+        check_unions = self.UNION_SEPARATOR.join([select_from + cte_name for cte_name, _ in blocks])
         # endregion
 
-        return f"{sql_body}\n{check_unions}"
+        return "\n".join((sql_body, check_unions))
+
+    def _build_check_blocks(self) -> List[Tuple[str, str]]:
+        """
+        Returns (cte name, cte block) pairs for all checks of the suite.
+
+        Checks whose rule is a single aggregate over the base CTE (see `RuleTemplateBase.aggregate_template`)
+        are fused into one CTE, so that they share a single scan of the base CTE. All other checks get their own CTE.
+        """
+        blocks: List[Tuple[str, str]] = []
+        aggregate_checks: List[Tuple[Check, str]] = []
+
+        for check in self.suite.checks:
+            if not check.rule_template:
+                raise ValueError(f"Check '{check.name}' has no associated rule template")
+            aggregate = check.rule_template.render_aggregate(helpers=self.helpers, extra_params=self._check_params(check))
+            if aggregate is None:
+                blocks.append((f"cte_{check.name}", self._build_check_cte(check)))
+            else:
+                aggregate_checks.append((check, aggregate))
 
+        # A single aggregate check gains nothing from fusing
+        if len(aggregate_checks) == 1:
+            check = aggregate_checks[0][0]
+            blocks.append((f"cte_{check.name}", self._build_check_cte(check)))
+        elif aggregate_checks:
+            blocks.append((self._fused_cte_name(), self._build_fused_cte(aggregate_checks)))
+
+        return blocks
 
     def _build_base_cte(self) -> str:
         """Returns SQL for the base CTE depending on DataSource type (TABLE, QUERY)"""
@@ -66,11 +162,6 @@ class SQLBuilder(AdsBase):
         else:
             sql_body = (f"-- Base CTE (Data Source Type > QUERY)\n"
                         f"WITH cte_{self.suite.name}_base AS (\n {self.suite.data_source.query} \n)")
-
-        # Apply Jinja templates
-        sql_body = self.helpers.string.render_jinja_template(value=sql_body,
-                                                             params=self.suite.params or {},
-                                                             keep_undefined_as_is=False)
         return sql_body
 
     def _build_check_cte(self, check: Check) -> str:
@@ -78,21 +169,46 @@ class SQLBuilder(AdsBase):
 
         if not check.rule_template:
             raise ValueError(f"Check '{check.name}' has no associated rule template")
-        sql_body = check.rule_template.render(
-            helpers=self.helpers,
-            extra_params={
-                **(check.params or {}),
-                "check_name": check.name,
-                "suite_name": self.suite.name,
-                "column_name": check.column_name
-            }
-        )
+        sql_body = check.rule_template.render(helpers=self.helpers, extra_params=self._check_params(check))
         check_description = f"[{check.description}]" if check.description else ""
         return (f"\n-- Check CTE - {check.name} {check_description}\n"
                 f"cte_{check.name} AS ({sql_body})")
 
+    def _fused_cte_name(self) -> str:
+        """Name of the fused CTE, outside the `cte_` prefix of check CTEs so that no check name can collide with it."""
+        return f"fused_{self.suite.name}_checks"
+
+    def _build_fused_cte(self, aggregate_checks: List[Tuple[Check, str]]) -> str:
+        """
+        Computes all aggregate checks side by side in a single pass over the base CTE,
+        then unpivots the single aggregate row into one (check_name, value) row per check.
+        """
+        aggregates = ",\n".join(
+            f"            -- {check.name}\n            {aggregate} AS value_{i}" for i, (check, aggregate) in enumerate(aggregate_checks)
+        )
+        unpivot = ",\n".join(
+            f"        STRUCT('{check.name}' AS check_name, CAST(aggregates.value_{i} AS FLOAT64) AS value)"
+            for i, (check, _) in enumerate(aggregate_checks)
+        )
+        return (f"\n-- Fused CTE - {len(aggregate_checks)} aggregate checks in a single scan of the base CTE\n"
+                f"{self._fused_cte_name()} AS (\n"
+                f"    SELECT fused.check_name, fused.value\n"
+                f"    FROM (\n"
+                f"        SELECT\n{aggregates}\n"
+                f"        FROM cte_{self.suite.name}_base\n"
+                f"    ) AS aggregates,\n"
+                f"    UNNEST([\n{unpivot}\n    ]) AS fused\n"
+                f")")
+
+    def _check_params(self, check: Check) -> Dict[str, Any]:
+        """Parameters a check's rule template is rendered with."""
+        return {
+            **(check.params or {}),
+            "check_name": check.name,
+            "suite_name": self.suite.name,
+            "column_name": check.column_name
+        }
+
     def _combine_cte_blocks(self, base_cte: str, check_ctes: List[str]) -> str:
         """Joins base CTE + all check CTEs + final UNION ALL into one SQL string"""
-        sql_body_items = [base_cte]
-        sql_body_items.extend(check_ctes)
-        return ", ".join(sql_body_items)
\ No newline at end of file
+        return self._CTE_SEPARATOR.join(chain((base_cte,), check_ctes))
\ No newline at end of file
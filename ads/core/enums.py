@@ -2,9 +2,10 @@ from enum import Enum
 
 
 # region CheckStatus
-class CheckStatus(Enum):
+class CheckStatus(str, Enum):
     """
     Enumeration representing the status of a check.
+    Members are also plain strings (CheckStatus.PASS == "PASS").
 
     CheckStatus indicates that the check passed, failed or with error.
 
@@ -21,13 +22,15 @@ class CheckStatus(Enum):
     FAIL = "FAIL"
     ERROR = "ERROR"
 
-    @property
     def is_fail(self) -> bool:
-        return self in (CheckStatus.FAIL, CheckStatus.ERROR)
+        return self in _FAIL_CHECK_STATUSES
+
+
+_FAIL_CHECK_STATUSES = frozenset((CheckStatus.FAIL, CheckStatus.ERROR))
 # endregion
 
 # region SuiteRunStatus
-class SuiteRunStatus(Enum):
+class SuiteRunStatus(str, Enum):
     UNKNOWN = "UNKNOWN"
     SUCCESS = "SUCCESS"
     FAILED = "FAILED"
@@ -36,7 +39,7 @@ class SuiteRunStatus(Enum):
 # endregion
 
 # region Severity
-class Severity(Enum):
+class Severity(str, Enum):
     """
     Enumeration representing the severity level of a data quality check.
 
@@ -60,7 +63,7 @@ class Severity(Enum):
 # endregion
 
 # region DataSourceType
-class DataSourceType(Enum):
+class DataSourceType(str, Enum):
     """
     Enumeration representing the type of data source.
 
@@ -79,10 +82,11 @@ class DataSourceType(Enum):
 # endregion
 
 # region ResultExportType
-class ResultExportType(Enum):
+class ResultExportType(str, Enum):
     JSON = "JSON"
     CSV = "CSV"
     SQLITE = "SQLITE"
     PROMETHEUS = "PROMETHEUS"
     HTML = "HTML"
+    MSGPACK = "MSGPACK"
 # endregion
@@ -1,10 +1,15 @@
 import csv
+import io
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ads.core.exporters.exporter_base import ExporterBase
 from ads.core.models import ResultsMetadata, Result
 
+# ASCII translation table for file names: alphanumerics and "-._" are kept, everything else becomes "_"
+_SANITIZE_TABLE = {i: (chr(i) if chr(i).isalnum() or chr(i) in "-._" else "_") for i in range(128)}
+
 
 class CsvExporter(ExporterBase):
     """
@@ -14,11 +19,69 @@ class CsvExporter(ExporterBase):
         <suite_name>_results.csv  - one row per check result
     """
 
+    RUN_COLUMNS: Tuple[str, ...] = (
+        "job_id",
+        "suite_name",
+        "suite_description",
+        "status",
+        "started_at",
+        "ended_at",
+        "duration_ms",
+        "bytes_processed",
+        "cache_hit",
+        "validate_first",
+        "validate_only",
+        "error_count",
+        "extra",
+    )
+    RESULT_COLUMNS: Tuple[str, ...] = (
+        "check_name",
+        "check_description",
+        "check_params",
+        "status",
+        "severity",
+        "value",
+        "threshold_lower",
+        "threshold_upper",
+        "message",
+    )
+    _RUN_COLUMNS_SET = frozenset(RUN_COLUMNS)
+    _RESULT_COLUMNS_SET = frozenset(RESULT_COLUMNS)
+
+    # Rows formatted in memory per chunk, then encoded and written as a single bytes block
+    WRITE_CHUNK_ROWS = 10_000
 
     def _sanitize_name(self, name: str) -> str:
         """Converts arbitrary suite names into filesystem-safe names."""
+        if name.isascii():
+            return name.translate(_SANITIZE_TABLE)
+        # Non-ASCII names keep unicode alphanumerics, so they go through the per-character path
         return "".join(c if c.isalnum() or c in "-._" else "_" for c in name)
 
+    def _write_csv(self,
+                   path: Path,
+                   header: Sequence[str],
+                   rows: Iterable[Sequence[Any]],
+                   column_delimiter: str,
+                   row_delimiter: str,
+                   config: Optional[Dict[Any, Any]] = None) -> None:
+        """Writes a CSV file in binary mode, encoding each chunk of formatted rows once."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=column_delimiter, lineterminator=row_delimiter)
+        writer.writerow(header)
+
+        rows = iter(rows)
+        with path.open("wb", buffering=self.FILE_BUFFER_SIZE) as f:
+            while True:
+                writer.writerows(islice(rows, self.WRITE_CHUNK_ROWS))
+                chunk = buffer.getvalue()
+                if not chunk:
+                    break
+                f.write(chunk.encode("utf-8"))
+                buffer.seek(0)
+                buffer.truncate()
+            self._finalize_file(f, config)
+
     def export(self,
                metadata: ResultsMetadata,
                results: List[Result],
@@ -31,7 +94,10 @@ class CsvExporter(ExporterBase):
             destination:
                 - If directory path: files are created inside it.
                 - If None: uses current working directory.
-            config: reserved for future options (e.g. custom filenames)
+            config:
+                - column_delimiter: CSV column delimiter (default ",")
+                - row_delimiter: CSV row delimiter (default "\\n")
+                - fsync: fsync the files before returning (default False)
         Returns:
             The directory path where CSV files are written (as string).
         """
@@ -53,90 +119,50 @@ class CsvExporter(ExporterBase):
         # endregion
 
         # region Prepare and write run payload
-        run_payload = metadata.model_dump(mode="json")
+        run_payload = dict(metadata.json_dict)
         run_payload.setdefault("error_count", len(metadata.errors or []))
-        run_columns = [
-            "job_id",
-            "suite_name",
-            "suite_description",
-            "status",
-            "started_at",
-            "ended_at",
-            "duration_ms",
-            "bytes_processed",
-            "cache_hit",
-            "validate_first",
-            "validate_only",
-            "error_count",
-            "extra",
-        ]
-
-        # Add dynamic columns
-        for key in run_payload.keys():
-            if key not in run_columns:
-                run_columns.append(key)
+        # Static columns first, then any additional (dynamic) metadata keys in payload order
+        run_columns = self.RUN_COLUMNS + tuple(key for key in run_payload if key not in self._RUN_COLUMNS_SET)
 
         # Run columns to run CSV file
-        with runs_csv_file.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f,
-                                    fieldnames=run_columns,
-                                    delimiter=column_delimiter,
-                                    lineterminator=row_delimiter)
-            writer.writeheader()
-            writer.writerow(run_payload)
+        self._write_csv(path=runs_csv_file,
+                        header=run_columns,
+                        rows=([run_payload.get(column) for column in run_columns],),
+                        column_delimiter=column_delimiter,
+                        row_delimiter=row_delimiter,
+                        config=config)
         # endregion
 
         # region Prepare and write results payloads
-        results_rows = []
-        for r in results:
-            data = r.model_dump(mode="json")
-            row = {
-                "check_name": data.get("check_name"),
-                "check_description": data.get("check_description"),
-                "check_params": data.get("check_params"),
-                "status": data.get("status"),
-                "severity": data.get("severity"),
-                "value": data.get("value"),
-                "threshold_lower": data.get("threshold_lower"),
-                "threshold_upper": data.get("threshold_upper"),
-                "message": data.get("message")
-            }
-
-            # Include dynamic fields
-            for key, value in data.items():
-                if key not in row:
-                    row[key] = value
-            results_rows.append(row)
-
-        if results_rows:
-            # region Write result rows
-            result_columns = list(results_rows[0].keys())
-            with results_csv_file.open("w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f,
-                                       fieldnames=result_columns,
-                                       delimiter=column_delimiter,
-                                       lineterminator=row_delimiter)
-                writer.writeheader()
-                writer.writerows(results_rows)
-            # endregion
-        else:
-            # region Write empty row
-            with results_csv_file.open("w", encoding="utf-8", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "check_name",
-                        "check_description",
-                        "check_params",
-                        "status",
-                        "severity",
-                        "value",
-                        "threshold_lower",
-                        "threshold_upper",
-                        "message",
-                    ])
-            # endregion
+        # Add dynamic columns (result schema is the same for every result)
+        dynamic_result_columns = [key for key in type(results[0]).model_fields if key not in self._RESULT_COLUMNS_SET] if results else []
+        result_columns = self.RESULT_COLUMNS + tuple(dynamic_result_columns)
+
+        # Rows are generated in the fixed column order straight from the Result attributes
+        # (no per-row pydantic JSON dump) and streamed into the CSV writer chunk by chunk
+        json_dumps = self.helpers.json.dumps
+        result_rows = (
+            (
+                r.check_name,
+                r.check_description,
+                json_dumps(r.check_params) if r.check_params is not None else None,
+                r.status.value,
+                r.severity.value,
+                r.value,
+                r.threshold_lower,
+                r.threshold_upper,
+                r.message,
+                *(getattr(r, column) for column in dynamic_result_columns)
+            )
+            for r in results
+        )
 
+        self._write_csv(path=results_csv_file,
+                        header=result_columns,
+                        rows=result_rows,
+                        column_delimiter=column_delimiter,
+                        row_delimiter=row_delimiter,
+                        config=config)
         # endregion
 
         self.logger.info(
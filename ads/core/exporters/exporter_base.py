@@ -1,5 +1,6 @@
+import os
 from abc import abstractmethod, ABC
-from typing import List, Optional, Dict, Any
+from typing import IO, List, Optional, Dict, Any
 
 from ads.core.base import AdsBase
 from ads.core.models import ResultsMetadata, Result
@@ -13,6 +14,20 @@ class ExporterBase(AdsBase, ABC):
     such as writing to files, databases, or metrics systems.
     """
 
+    # Buffer size for exported files, amortizes write syscalls for large result sets
+    FILE_BUFFER_SIZE = 1 << 20
+
+    def _finalize_file(self, f: IO, config: Optional[Dict[Any, Any]] = None) -> None:
+        """
+        Forces written data to disk when `config["fsync"]` is set.
+
+        Off by default: exports rely on OS-buffered writes, the file is flushed once on close.
+        Must be called once at the end of the `with open(...)` block, never per row.
+        """
+        if (config or {}).get("fsync", False):
+            f.flush()
+            os.fsync(f.fileno())
+
     @abstractmethod
     def export(self,
                metadata: ResultsMetadata,
@@ -1,23 +1,98 @@
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
 from ads.core.enums import ResultExportType
-from ads.core.exporters.csv_exporter import CsvExporter
 from ads.core.exporters.exporter_base import ExporterBase
-from ads.core.exporters.json_exporter import JsonExporter
-from ads.core.exporters.prometheus_exporter import PrometheusExporter
-from ads.core.exporters.sqlite_exporter import SQLiteExporter
+from ads.core.models import ResultsMetadata, Result
 
 
 class ExporterRegistry:
-    """Registry for available exporters."""
+    """
+    Registry for available exporters.
+
+    Exporter modules are imported and instantiated only on first use of their export type,
+    so picking one format does not pull in the dependencies (sqlite3, requests, jinja2, ...) of the others.
+    """
+
+    # Export type -> (module, class name) of the exporter
+    EXPORTER_PATHS: Dict[ResultExportType, Tuple[str, str]] = {
+        ResultExportType.JSON: ("ads.core.exporters.json_exporter", "JsonExporter"),
+        ResultExportType.SQLITE: ("ads.core.exporters.sqlite_exporter", "SQLiteExporter"),
+        ResultExportType.PROMETHEUS: ("ads.core.exporters.prometheus_exporter", "PrometheusExporter"),
+        ResultExportType.CSV: ("ads.core.exporters.csv_exporter", "CsvExporter"),
+        ResultExportType.HTML: ("ads.core.exporters.html_exporter", "HtmlExporter"),
+        ResultExportType.MSGPACK: ("ads.core.exporters.msgpack_exporter", "MsgpackExporter")
+    }
 
     def __init__(self):
-        self._exporters = {
-            ResultExportType.JSON: JsonExporter(),
-            ResultExportType.SQLITE: SQLiteExporter(),
-            ResultExportType.PROMETHEUS: PrometheusExporter(),
-            ResultExportType.CSV: CsvExporter()
-        }
+        self._exporters: Dict[ResultExportType, ExporterBase] = {}
 
     def get(self, export_type: ResultExportType) -> ExporterBase:
-        if export_type not in self._exporters:
-            raise ValueError(f"No available exporter found for type '{export_type.name}'")
-        return self._exporters[export_type]
\ No newline at end of file
+        exporter = self._exporters.get(export_type)
+        if exporter is None:
+            if export_type not in self.EXPORTER_PATHS:
+                raise ValueError(f"No available exporter found for type '{export_type.name}'")
+            module_name, class_name = self.EXPORTER_PATHS[export_type]
+            exporter_class = getattr(importlib.import_module(module_name), class_name)
+            exporter = self._exporters.setdefault(export_type, exporter_class())
+        return exporter
+
+    def run_all(self,
+                export_types: Sequence[ResultExportType],
+                metadata: ResultsMetadata,
+                results: List[Result],
+                destinations: Optional[Dict[ResultExportType, Optional[str]]] = None,
+                configs: Optional[Dict[ResultExportType, Optional[Dict[Any, Any]]]] = None) -> Dict[ResultExportType, Optional[str]]:
+        """
+        Runs several exporters for the same run concurrently.
+
+        Exporters are I/O bound (file writes, HTTP pushes), so running them on a thread pool
+        brings the wall time down from the sum to roughly the slowest exporter.
+
+        Args:
+            export_types: export types to run
+            metadata: suite-level execution metadata
+            results: list of Result objects
+            destinations: optional destination per export type
+            configs: optional config per export type
+        Returns:
+            Export type -> value returned by the exporter (usually the written path)
+        Raises:
+            RuntimeError: if any exporter failed, after all the others have completed
+        """
+        destinations = destinations or {}
+        configs = configs or {}
+
+        # Exporters are resolved up-front, so lazy instantiation never races between threads
+        exporters = {export_type: self.get(export_type=export_type) for export_type in dict.fromkeys(export_types)}
+        if not exporters:
+            return {}
+
+        # Serialize the metadata once before fanning out: every exporter reads the cached
+        # `json_dict`, and threads would otherwise race to build it concurrently
+        metadata.warm_json_cache()
+
+        with ThreadPoolExecutor(max_workers=len(exporters), thread_name_prefix="ads-exporter") as pool:
+            futures = {
+                export_type: pool.submit(exporter.export,
+                                         metadata=metadata,
+                                         results=results,
+                                         destination=destinations.get(export_type),
+                                         config=configs.get(export_type))
+                for export_type, exporter in exporters.items()
+            }
+
+        exported, errors = {}, {}
+        for export_type, future in futures.items():
+            error = future.exception()
+            if error is None:
+                exported[export_type] = future.result()
+            else:
+                errors[export_type] = error
+
+        if errors:
+            failed = ", ".join(f"{export_type.name}: {error}" for export_type, error in errors.items())
+            raise RuntimeError(f"Export failed for {failed}") from next(iter(errors.values()))
+
+        return exported
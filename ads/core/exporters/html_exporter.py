@@ -1,14 +1,49 @@
 import base64
 import datetime
+import functools
 import re
 from pathlib import Path
-from tokenize import endpats
 from typing import List, Optional, Dict, Any
 
+import jinja2
 import requests
+from requests.adapters import HTTPAdapter
 
 from ads.core.exporters.exporter_base import ExporterBase
 from ads.core.models import ResultsMetadata, Result
+from ads.helpers.string_helper import BYTECODE_CACHE
+
+_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+
+# Module-wide HTTP session, keeps connections (and TLS sessions) alive across exports
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_html_template(template_directory: str, template_file: str) -> jinja2.Template:
+    """Loads and compiles the HTML report template once per template directory."""
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_directory),
+        undefined=jinja2.StrictUndefined,
+        auto_reload=False,
+        bytecode_cache=BYTECODE_CACHE
+    )
+    return env.get_template(template_file)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_logo_base64(logo_path: str, is_url: bool) -> str:
+    """Fetches/reads a logo once per path and returns it Base64-encoded."""
+    if is_url:
+        response = _SESSION.get(logo_path)
+        response.raise_for_status()
+        image_data = response.content
+    else:
+        with open(logo_path, "rb") as f:
+            image_data = f.read()
+    return base64.b64encode(image_data).decode("utf-8")
 
 
 class HtmlExporter(ExporterBase):
@@ -38,19 +73,12 @@ class HtmlExporter(ExporterBase):
         Returns:
             Base64-encoded string of the image
         """
-        is_url = re.match(r"^http?://", logo_path, re.IGNORECASE)
+        is_url = bool(_URL_RE.match(logo_path))
 
         try:
-            if is_url:
-                response = requests.get(logo_path)
-                response.raise_for_status()
-                image_data = response.content
-            else:
-                if not self.helpers.filesystem.file_exists(path=Path(logo_path)):
-                    raise FileNotFoundError(f"File not found: {logo_path}")
-                with open(logo_path, "rb") as f:
-                    image_data = f.read()
-            return base64.b64encode(image_data).decode("utf-8")
+            if not is_url and not self.helpers.filesystem.file_exists(path=Path(logo_path)):
+                raise FileNotFoundError(f"File not found: {logo_path}")
+            return _load_logo_base64(logo_path, is_url)
         except Exception as e:
             raise RuntimeError(f"Failed to process image: {e}")
 
@@ -70,19 +98,20 @@ class HtmlExporter(ExporterBase):
                 - template_base_dir: HTML template directory
                 - custom_message: str
                 - custom_logo_path or URL: str (overwrite default logo)
+                - fsync: fsync the HTML file before returning (default False)
         Returns:
             Rendered HTML content
         """
 
         # region Load and render template HTML and prepare logo embedding
-        template_directory = (config or {}).get("template_base_dir", self.TEMPLATE_DIR)
-        html_filename = template_directory / "html_template.html"
+        template_directory = Path((config or {}).get("template_base_dir", self.TEMPLATE_DIR))
+        html_filename = template_directory / self.TEMPLATE_FILE
         logo_filename = template_directory / "logo.png"
         custom_logo_path = (config or {}).get("custom_logo_path", None)
 
         if not self.helpers.filesystem.file_exists(path=html_filename):
             self.logger.error(f"HTML template file '{html_filename.resolve()}' not found")
-            raise
+            raise FileNotFoundError(f"HTML template file '{html_filename.resolve()}' not found")
 
         logo_base64 = None
         if custom_logo_path:
@@ -90,28 +119,26 @@ class HtmlExporter(ExporterBase):
         elif self.helpers.filesystem.file_exists(path=logo_filename):
             logo_base64 = self._get_logo_base64(logo_path=str(logo_filename.resolve()))
 
-        html_content = None
-        with open(html_filename, "r", encoding="utf-8") as f:
-            html_content = self.helpers.string.render_jinja_template(
-                value=f.read(),
-                params=dict(
-                    suite_name=metadata.suite_name,
-                    suite_description=metadata.suite_description,
-                    metadata=metadata.model_dump(mode="json"),
-                    results=results,
-                    logo_base64=logo_base64,
-                    custom_message=(config or {}).get("custom_message", None),
-                    generation_time=datetime.datetime.now(datetime.UTC).strftime("%d.%m.%Y %H:%M:%S UTC")
-                ),
-                keep_undefined_as_is=False
-            )
+        # Compiled template is cached per directory, so repeated exports skip file I/O and parsing
+        template = _load_html_template(str(template_directory.resolve()), self.TEMPLATE_FILE)
+        html_content = template.render(
+            suite_name=metadata.suite_name,
+            suite_description=metadata.suite_description,
+            metadata=metadata.json_dict,
+            results=results,
+            logo_base64=logo_base64,
+            custom_message=(config or {}).get("custom_message", None),
+            generation_time=datetime.datetime.now(datetime.UTC).strftime("%d.%m.%Y %H:%M:%S UTC")
+        )
         # endregion
 
         # region Export HTML if destination path defined
         if destination:
             output_path = Path(destination)
             self.helpers.filesystem.create_parent_directories(path=output_path.parent)
-            output_path.write_text(data=html_content, encoding="utf-8")
+            with output_path.open("w", encoding="utf-8", buffering=self.FILE_BUFFER_SIZE) as f:
+                f.write(html_content)
+                self._finalize_file(f, config)
             self.logger.info(f"HTML report generated: {output_path.resolve()}")
         # endregion
 
@@ -1,6 +1,5 @@
-import json
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict
 
 from ads.core.exporters.exporter_base import ExporterBase
 from ads.core.models import ResultsMetadata, Result
@@ -18,18 +17,36 @@ class JsonExporter(ExporterBase):
                metadata: ResultsMetadata,
                results: List[Result],
                destination: Optional[str] = None,
-               config: Optional[Any, Any] = None) -> Optional[str]:
+               config: Optional[Dict[Any, Any]] = None) -> Optional[str]:
+        """
+        Streams metadata and results into a JSON document of the form {"metadata": {...}, "results": [...]}.
+
+        Args:
+            metadata: suite-level execution metadata
+            results: list of Result objects
+            destination: optional output JSON path
+            config:
+                - indent: optional indent for pretty-printed output (compact by default)
+                - fsync: fsync the file before returning (default False)
+        """
         output_path = Path(destination or "ads_results.json")
-
-        payload = dict(
-            metadata=metadata.model_dump(mode="json"),
-            results=[r.model_dump(mode="json") for r in results]
-        )
+        indent = (config or {}).get("indent", None)
 
         self.helpers.filesystem.create_parent_directories(path=output_path.parent)
 
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=5, ensure_ascii=False)
+        # Results are serialized and written one by one inside the JSON framing,
+        # so the full payload is never materialized in memory
+        dumps_bytes = self.helpers.json.dumps_bytes
+        with output_path.open("wb", buffering=self.FILE_BUFFER_SIZE) as f:
+            f.write(b'{"metadata":')
+            f.write(dumps_bytes(metadata.json_dict, indent=indent))
+            f.write(b',"results":[')
+            for i, r in enumerate(results):
+                if i:
+                    f.write(b",")
+                f.write(dumps_bytes(r.json_dict, indent=indent))
+            f.write(b"]}")
+            self._finalize_file(f, config)
 
         self.logger.info(f"Results exported to '{output_path.resolve()}'")
 
@@ -0,0 +1,52 @@
+from pathlib import Path
+from typing import List, Optional, Any, Dict
+
+from ads.core.exporters.exporter_base import ExporterBase
+from ads.core.models import ResultsMetadata, Result
+
+try:
+    import msgpack
+except ImportError:  # optional dependency, see the `msgpack` extra
+    msgpack = None
+
+
+class MsgpackExporter(ExporterBase):
+    """
+    Writes execution results and metadata to a MessagePack file.
+
+    Same document as the JSON exporter ({"metadata": {...}, "results": [...]}), in a compact
+    binary encoding for tools that do not need JSON. Requires the optional `msgpack` package.
+
+    If no destination is provided, defaults to `ads_results.msgpack`
+    in the current working directory.
+    """
+
+    def export(self,
+               metadata: ResultsMetadata,
+               results: List[Result],
+               destination: Optional[str] = None,
+               config: Optional[Dict[Any, Any]] = None) -> Optional[str]:
+        """
+        Args:
+            metadata: suite-level execution metadata
+            results: list of Result objects
+            destination: optional output path
+            config:
+                - fsync: fsync the file before returning (default False)
+        """
+        if msgpack is None:
+            raise ImportError("MessagePack export requires the 'msgpack' package, "
+                              "install with 'argos-data-sentinel[msgpack]'")
+
+        output_path = Path(destination or "ads_results.msgpack")
+        self.helpers.filesystem.create_parent_directories(path=output_path.parent)
+
+        payload = msgpack.packb({"metadata": metadata.json_dict, "results": [r.json_dict for r in results]},
+                                use_bin_type=True)
+        with output_path.open("wb") as f:
+            f.write(payload)
+            self._finalize_file(f, config)
+
+        self.logger.info(f"Results exported to '{output_path.resolve()}'")
+
+        return str(output_path.resolve())
@@ -4,10 +4,20 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ads.core.exporters.exporter_base import ExporterBase
 from ads.core.models import ResultsMetadata, Result
 
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_:]")
+# Label value escaping of the Prometheus text exposition format
+_PROM_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+# Module-wide HTTP session, keeps connections (and TLS sessions) alive across exports
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 class PrometheusExporter(ExporterBase):
     """
@@ -22,6 +32,7 @@ class PrometheusExporter(ExporterBase):
     """
 
     METRIC_PREFIX = "ads"
+    PUSHGATEWAY_HEADERS = {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
 
 
     def export(self, metadata: ResultsMetadata, results: List[Result], destination: Optional[str] = None,
@@ -37,36 +48,27 @@ class PrometheusExporter(ExporterBase):
                 - "pushgateway_url": str (e.g., "http://localhost:9091")
                 - "job_name": str
                 - "labels": dict of extra labels
+                - "fsync": fsync the `.prom` file before returning (default False)
         """
 
-        lines = []
         suite_name = getattr(metadata, "suite_name", "unknown_suite")
         timestamp = int(time.time())
 
-        for r in results:
-
-            # region Prepare and append metric line
-            metric_name = self._sanitize_metric_name(f"{self.METRIC_PREFIX}_check_value")
-
-            labels = {
-                "suite": suite_name,
-                "check": r.check_name,
-                "status": self.helpers.enum.get_value(r.status),
-                "severity": self.helpers.enum.get_value(r.severity)
-            }
-
-            # region Merge with user specific labels
-            user_specific_labels = (config or {}).get("labels", {})
-            labels.update(user_specific_labels)
-            # endregion
-
-            label_str = ",".join(f'{k}={v}' for k, v in labels.items())
-            value = r.value or 0
-
-            lines.append(f"{metric_name}{{{label_str}}} {value} {timestamp}")
-            # endregion
+        # region Hoist per-export constants out of the results loop
+        metric_name = self._sanitize_metric_name(f"{self.METRIC_PREFIX}_check_value")
+        suite_label = str(suite_name).translate(_PROM_ESCAPE)
+        user_specific_labels = {k: str(v).translate(_PROM_ESCAPE) for k, v in (config or {}).get("labels", {}).items()}
+        # endregion
 
-        metrics_text = "\n".join(lines)
+        # region Build metric lines (user specific labels override the defaults), joined straight from a generator
+        # Encoded once, the same bytes are pushed or written in a single write
+        format_labels = self._format_labels
+        result_labels = self._result_labels
+        metrics_payload = "\n".join(
+            f"{metric_name}{{{format_labels(result_labels(r, suite_label, user_specific_labels))}}} {r.value or 0} {timestamp}"
+            for r in results
+        ).encode("utf-8")
+        # endregion
 
         # region PushGateway
         if (config or {}).get("pushgateway_url"):
@@ -75,7 +77,10 @@ class PrometheusExporter(ExporterBase):
             job_name = config.get("job_name", suite_name)
             full_url = f"{push_url}/metrics/job/{job_name}"
             try:
-                response = requests.post(full_url, data=metrics_text, timeout=5)
+                response = _SESSION.post(full_url,
+                                         data=metrics_payload,
+                                         headers=self.PUSHGATEWAY_HEADERS,
+                                         timeout=5)
                 if response.status_code != 202:
                     self.logger.warning(f"Pushgateway returned {response.status_code}: {response.text}")
                 else:
@@ -88,12 +93,30 @@ class PrometheusExporter(ExporterBase):
 
         output_path = Path(destination or f"{suite_name}.prom")
         self.helpers.filesystem.create_parent_directories(path=output_path.parent)
-        output_path.write_text(metrics_text)
+        with output_path.open("wb") as f:
+            f.write(metrics_payload)
+            self._finalize_file(f, config)
         self.logger.info(f"Prometheus metrics written → {output_path.resolve()}")
 
         return str(output_path.resolve())
 
+    @staticmethod
+    def _result_labels(result: Result, suite_label: str, user_specific_labels: Dict[str, str]) -> Dict[str, str]:
+        """Builds the (escaped) labels of a result's metric line, user specific labels override the defaults."""
+        return {
+            "suite": suite_label,
+            "check": result.check_name.translate(_PROM_ESCAPE),
+            "status": result.status.value,
+            "severity": result.severity.value,
+            **user_specific_labels
+        }
+
+    @staticmethod
+    def _format_labels(labels: Dict[str, Any]) -> str:
+        """Formats labels as a comma separated `key="value"` list, values must be escaped already."""
+        return ",".join(f'{k}="{v}"' for k, v in labels.items())
+
     @staticmethod
     def _sanitize_metric_name(name: str) -> str:
         """Ensures Prometheus-compatible metric name."""
-        return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+        return _SANITIZE_RE.sub("_", name)
@@ -1,13 +1,23 @@
-import json
+import functools
 import sqlite3
-from multiprocessing.reduction import send_handle
+from contextlib import closing
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-
-from pydantic.v1.json import custom_pydantic_encoder
+from typing import List, Optional, Dict, Any, FrozenSet, Tuple
 
 from ads.core.exporters.exporter_base import ExporterBase
 from ads.core.models import ResultsMetadata, Result
+from ads.helpers.string_helper import StringHelper
+
+
+@functools.lru_cache(maxsize=16)
+def _render_sql_template(sql_path: str, params: FrozenSet[Tuple[str, Any]]) -> str:
+    """Reads and renders a DDL template once per (path, params) pair."""
+    with open(sql_path, "r", encoding="utf-8") as f:
+        return StringHelper.render_jinja_template(
+            value=f.read(),
+            params=dict(params),
+            keep_undefined_as_is=False
+        )
 
 
 class SQLiteExporter(ExporterBase):
@@ -21,8 +31,23 @@ class SQLiteExporter(ExporterBase):
     TEMPLATE_RUNS_SQL_FILE = "table__ads_runs.sql"
     TEMPLATE_RESULTS_SQL_FILE = "table__ads_results.sql"
 
-    def _ensure_database(self, db_path: Path, runs_table: str, results_table: str) -> None:
-        """Initializes database and creates schema if not present."""
+    # Append-only results log: WAL journal with one fsync per checkpoint instead of per commit
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+    )
+
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """Opens a SQLite connection tuned for bulk inserts."""
+        conn = sqlite3.connect(db_path)
+        for pragma in self.SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _ensure_database(self, conn: sqlite3.Connection, runs_table: str, results_table: str) -> None:
+        """Creates schema if not present, using the given (already open) connection."""
         try:
             # region Load ADS Runs SQL query
             sql_ads_runs = self._load_sql_template(
@@ -38,16 +63,10 @@ class SQLiteExporter(ExporterBase):
             )
             # endregion
 
-            # region Auto create missing parent directories
-            self.helpers.filesystem.create_parent_directories(path=db_path.parent)
-            # endregion
-
-            # region Create/Check database and tables
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-                cursor.executescript(sql_ads_runs)
-                cursor.executescript(sql_ads_results)
-                conn.commit()
+            # region Create/Check tables
+            cursor = conn.cursor()
+            cursor.executescript(sql_ads_runs)
+            cursor.executescript(sql_ads_results)
             # endregion
         except Exception as e:
             self.logger.error(f"Failed to initialize SQLite DB: {e}")
@@ -55,12 +74,7 @@ class SQLiteExporter(ExporterBase):
 
     def _load_sql_template(self, sql_path: Path, params: Dict[str, Any]) -> str:
         """Loads SQL template and apply Jinja templates."""
-        with open("templates/sqlite_exporter/table__ads_results.sql", "r") as f:
-            return self.helpers.string.render_jinja_template(
-            value=f.read(),
-            params=params,
-            keep_undefined_as_is=False
-        )
+        return _render_sql_template(str(sql_path), frozenset(params.items()))
 
     def export(self,
                metadata: ResultsMetadata,
@@ -82,13 +96,18 @@ class SQLiteExporter(ExporterBase):
 
         db_file = Path(destination or "ads_database.db")
 
-        # region Ensure database and tables first
-        self._ensure_database(db_path=db_file,
-                              runs_table=runs_table_name,
-                              results_table=results_table_name)
+        # region Auto create missing parent directories
+        self.helpers.filesystem.create_parent_directories(path=db_file.parent)
         # endregion
 
-        with sqlite3.connect(db_file) as conn:
+        # Single connection for schema bootstrap and inserts (closed on exit, uncommitted work is rolled back)
+        with closing(self._connect(db_file)) as conn:
+            # region Ensure tables first
+            self._ensure_database(conn=conn,
+                                  runs_table=runs_table_name,
+                                  results_table=results_table_name)
+            # endregion
+
             cursor = conn.cursor()
             conn.execute("BEGIN")
 
@@ -113,7 +132,7 @@ class SQLiteExporter(ExporterBase):
                 metadata.job_id,
                 metadata.suite_name,
                 metadata.suite_description,
-                self.helpers.enum.get_value(metadata.status.value),
+                metadata.status.value if metadata.status is not None else None,
                 metadata.started_at,
                 metadata.ended_at,
                 metadata.duration_ms,
@@ -122,39 +141,42 @@ class SQLiteExporter(ExporterBase):
                 metadata.validate_first,
                 metadata.validate_only,
                 len(metadata.errors or []),
-                json.dumps(metadata.extra or {})
+                self.helpers.json.dumps(metadata.extra or {})
             ))
 
             run_id = cursor.lastrowid
             # endregion
 
-            # region Insert ADS results
-            for r in results:
-                cursor.execute(f"""
-                INSERT INTO {results_table_name} (
-                    run_id,
-                    check_name,
-                    check_description,
-                    check_params,
-                    status,
-                    severity,
-                    value,
-                    threshold_lower,
-                    threshold_upper,
-                    message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,(
+            # region Insert ADS results (single prepared statement for all results)
+            json_dumps = self.helpers.json.dumps
+            cursor.executemany(f"""
+            INSERT INTO {results_table_name} (
+                run_id,
+                check_name,
+                check_description,
+                check_params,
+                status,
+                severity,
+                value,
+                threshold_lower,
+                threshold_upper,
+                message
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                (
                     run_id,
                     r.check_name,
                     r.check_description,
-                    json.dumps(r.check_params or {}),
-                    self.helpers.enum.get_value(r.status.value),
-                    self.helpers.enum.get_value(r.severity),
+                    json_dumps(r.check_params or {}),
+                    r.status.value,
+                    r.severity.value,
                     r.value,
                     r.threshold_lower,
                     r.threshold_upper,
                     r.message
-                ))
+                )
+                for r in results
+            ))
             # endregion
 
             conn.commit()
@@ -12,6 +12,6 @@ CREATE TABLE IF NOT EXISTS {{ads_runs_table_name}} (
     validate_first BOOLEAN,
     validate_only BOOLEAN,
     error_count INTEGER,
-    extra TEXT
+    extra TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
\ No newline at end of file
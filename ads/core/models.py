@@ -1,11 +1,42 @@
-from datetime import datetime
-from enum import Enum
-from typing import Optional, Literal, List, Dict, Any
-from pydantic import BaseModel, Field
+import hashlib
+import json
+import sys
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from ads.core.enums import DataSourceType, Severity, CheckStatus, SuiteRunStatus
 from ads.core.rules.rule_template_base import RuleTemplateBase
 
+# region JsonDictCachedModel
+class JsonDictCachedModel(BaseModel):
+    """
+    Base model caching its JSON-mode dump.
+
+    Several exporters usually serialize the same Result/ResultsMetadata objects of a run,
+    `json_dict` runs the pydantic serialization only once per instance. The cache is
+    dropped whenever a field is assigned (in-place changes of nested lists/dicts are not tracked).
+    """
+    _json_dict_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    @property
+    def json_dict(self) -> Dict[str, Any]:
+        """Cached `model_dump(mode="json")` output, must be treated as read-only"""
+        if self._json_dict_cache is None:
+            self._json_dict_cache = self.model_dump(mode="json")
+        return self._json_dict_cache
+
+    def warm_json_cache(self) -> None:
+        """Builds the cached `json_dict` now (e.g. before several threads read it concurrently)"""
+        if self._json_dict_cache is None:
+            self._json_dict_cache = self.model_dump(mode="json")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._json_dict_cache = None
+# endregion
+
 # region DataSource
 class DataSource(BaseModel):
     """
@@ -69,28 +100,35 @@ class Threshold(BaseModel):
     Rules:
         - If only `value` is set → lower = upper = value
         - If both lower and upper are set → comparison is range-based
+
+    Thresholds are immutable, so a single instance can be shared by any number of checks and results.
     """
+    model_config = ConfigDict(frozen=True)
+
     lower: Optional[float] = Field(None, description="Lower limit of the threshold")
     upper: Optional[float] = Field(None, description="Upper limit of the threshold")
 
+    # Open bounds as infinities, so that `is_within` is a single chained comparison
+    _lo: float = PrivateAttr(default=float("-inf"))
+    _hi: float = PrivateAttr(default=float("inf"))
+
     def __init__(self,
                  value: Optional[float] = None,
                  lower: Optional[float] = None,
                  upper: Optional[float] = None):
-        super().__init__(lower=lower, upper=upper)
         if value is not None:
-            self.lower = value
-            self.upper = value
+            lower = upper = value
+        super().__init__(lower=lower, upper=upper)
+
+    def model_post_init(self, context: Any) -> None:
+        if self.lower is not None:
+            self._lo = self.lower
+        if self.upper is not None:
+            self._hi = self.upper
 
     def is_within(self, val: float) -> bool:
-        """Returns True if value is within threshold bounds."""
-        if self.lower is None and self.upper is None:  # Threshold not defined, always True
-            return True
-        if self.lower is not None and val < self.lower:
-            return False
-        if self.upper is not None and val > self.upper:
-            return False
-        return True
+        """Returns True if value is within threshold bounds (always True when the threshold is not defined)."""
+        return self._lo <= val <= self._hi
 
     def describe(self) -> str:
         """Readable text for debugging or reporting."""
@@ -124,6 +162,12 @@ class Check(BaseModel):
     params: Optional[Dict[str, Any]] = Field(None, description="Parameter substitutions for the rule template")
     severity: Severity = Field(Severity.ERROR, description="Severity level of this check")
     threshold: Optional[Threshold] = Field(None, description="Threshold boundries for this check")
+
+    @field_validator("name")
+    @classmethod
+    def _intern_name(cls, value: str) -> str:
+        # Check names are a small closed set shared by every Result of the check
+        return sys.intern(value)
 # endregion
 
 # region Suite
@@ -153,10 +197,37 @@ class Suite(BaseModel):
     params: Optional[Dict[str, Any]] = Field(None, description="Parameter substitutions for the suite")
     checks: List[Check] = Field(default_factory=list, description="List of checks belonging to this suite")
     tags: Optional[Dict[Any, Any]] = Field(None, description="Optional key-value tags for metadata or filtering")
+
+    def fingerprint(self) -> str:
+        """
+        Stable content hash of everything the compiled suite SQL depends on.
+
+        Covers the suite name, data source, suite params and, per check, its name, description,
+        column, params and rule (class and rule params). Metadata such as owner, domain or tags is excluded.
+        """
+        payload = {
+            "name": self.name,
+            "data_source": [self.data_source.type.value, self.data_source.table, self.data_source.query],
+            "params": self.params,
+            "checks": [
+                [
+                    check.name,
+                    check.description,
+                    check.column_name,
+                    check.params,
+                    f"{type(check.rule_template).__module__}.{type(check.rule_template).__qualname__}",
+                    check.rule_template.params if check.rule_template is not None else None,
+                ]
+                for check in self.checks
+            ],
+        }
+        # Non-JSON values (dates, compiled patterns, ...) are hashed by their repr
+        encoded = json.dumps(payload, sort_keys=True, default=repr, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 # endregion
 
 # region Result
-class Result(BaseModel):
+class Result(JsonDictCachedModel):
     """
     Represents the execution outcome of a single Check after the suite is run.
 
@@ -170,8 +241,10 @@ class Result(BaseModel):
         - execution timestamps
 
     Results are later passed to exporters (JSON, Prometheus, SQLite, etc.)
-    for persistence or monitoring.
+    for persistence or monitoring. Results are immutable once created.
     """
+    model_config = ConfigDict(frozen=True)
+
     check_name: str = Field(..., description="The name of the check that produced this result")
     check_description: Optional[str] = Field(None, description="Optional human-readable description of this result")
     check_params: Optional[Dict[str, Any]] = Field(None, description="Parameter substitutions for check")
@@ -181,10 +254,47 @@ class Result(BaseModel):
     value: Optional[float] = Field(None, description="Numeric value evaluated for threshold comparison")
     threshold_lower: Optional[float] = Field(None, description="Lower boundary of threshold")
     threshold_upper: Optional[float] = Field(None, description="Upper boundary of threshold")
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "Result":
+        """
+        Builds a Result without validation (`model_construct`).
+
+        Used by the ResultParser, whose values are already typed (enums, floats) by the engine.
+        External input must go through the regular constructor.
+        """
+        # Check names are a small closed set shared by every Result of the check
+        if isinstance(data.get("check_name"), str):
+            data["check_name"] = sys.intern(data["check_name"])
+        return cls.model_construct(**data)
+# endregion
+
+# region ResultRow
+@dataclass(slots=True, frozen=True)
+class ResultRow:
+    """
+    Lightweight, slotted counterpart of Result, one per check output row.
+
+    Produced by `ResultParser.parse_rows` from trusted engine output (no validation, no `__dict__`).
+    Converted to a Result with `to_result()` only where the pydantic model (JSON schema/dumps) is needed.
+    """
+    check_name: str
+    status: CheckStatus = CheckStatus.ERROR
+    severity: Severity = Severity.WARN
+    message: Optional[str] = None
+    value: Optional[float] = None
+    threshold_lower: Optional[float] = None
+    threshold_upper: Optional[float] = None
+    check_description: Optional[str] = None
+    check_params: Optional[Dict[str, Any]] = None
+
+    def to_result(self) -> Result:
+        # Shallow field copy (dataclasses.asdict would deep-copy check_params)
+        return Result.from_trusted(**{name: getattr(self, name) for name in self.__slots__})
 # endregion
 
 # region ResultsMetadata
-class ResultsMetadata(BaseModel):
+class ResultsMetadata(JsonDictCachedModel):
     """
     Represents metadata for a full Suite execution.
 
@@ -194,6 +304,9 @@ class ResultsMetadata(BaseModel):
         - dry-run validation
         - execution status and errors
     """
+    # Unknown fields are rejected instead of being carried on every instance, custom values go to `extra`
+    model_config = ConfigDict(extra="forbid")
+
     suite_name: str = Field(..., description="Suite name")
     suite_description: Optional[str] = Field(None, description="Suite description")
     job_id: Optional[str] = Field(None, description="BigQuery job ID")
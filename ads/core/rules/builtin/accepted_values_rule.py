@@ -10,11 +10,12 @@ class AcceptedValuesRule(RuleTemplateBase):
 
     name: ClassVar[str] = "accepted_values"
     description: ClassVar[str] = "Counts values not in the accepted list."
-    sql_template: ClassVar[str] = """
-SELECT 
-    '{{ check_name }}' AS check_name,
-    COUNTIF({{ column_name }} NOT IN ({{ accepted_values | join(', ') }})) AS value
-FROM
-    cte_{{ suite_name }}_base
-    """
+    # Small lists stay a plain IN list, large ones become an array BigQuery hashes once instead of scanning per row
+    aggregate_template: ClassVar[str] = (
+        "{% if accepted_values | length < 16 %}"
+        "COUNTIF({{ column_name }} NOT IN ({{ accepted_values | join(', ') }}))"
+        "{% else %}"
+        "COUNTIF({{ column_name }} NOT IN UNNEST([{{ accepted_values | join(', ') }}]))"
+        "{% endif %}"
+    )
     required_params: ClassVar[List[str]] = ["column_name", "accepted_values"]
\ No newline at end of file
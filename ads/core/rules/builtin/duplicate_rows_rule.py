@@ -6,6 +6,9 @@ from ads.core.rules.rule_template_base import RuleTemplateBase
 class DuplicateRowsRule(RuleTemplateBase):
     """
     Detects duplicate records based on a combination of key columns.
+
+    Key columns are compared as a STRUCT, which keeps the column types (no STRING coercion)
+    and is NULL/collision safe, unlike a concatenation of the values.
     """
 
     name: ClassVar[str] = "duplicate_rows"
@@ -13,8 +16,8 @@ class DuplicateRowsRule(RuleTemplateBase):
     sql_template: ClassVar[str] = """
 SELECT 
     '{{ check_name }}' AS check_name,
-    COUNT(*) - COUNT(DISTINCT CONCAT({{ column_names | join(', ') }})) AS value
+    COUNT(*) - COUNT(DISTINCT STRUCT({{ column_names | join(', ') }})) AS value
 FROM
     cte_{{ suite_name }}_base
     """
-    required_params: ClassVar[List[str]] = ["check_name", "suite_name", "column_names"]
\ No newline at end of file
+    required_params: ClassVar[List[str]] = ["column_names"]
\ No newline at end of file
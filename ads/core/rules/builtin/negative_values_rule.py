@@ -10,11 +10,5 @@ class NegativeValuesRule(RuleTemplateBase):
 
     name: ClassVar[str] = "negative_values"
     description: ClassVar[str] = "Counts negative values in a numeric column."
-    sql_template: ClassVar[str] = """
-SELECT 
-    '{{ check_name }}' AS check_name,
-    COUNTIF({{ column_name }} < 0) AS value
-FROM
-    cte_{{ suite_name }}_base
-    """
+    aggregate_template: ClassVar[str] = "COUNTIF({{ column_name }} < 0)"
     required_params: ClassVar[List[str]] = ["column_name"]
\ No newline at end of file
@@ -11,10 +11,5 @@ class NotNullRule(RuleTemplateBase):
 
     name: ClassVar[str] = "not_null"
     description: ClassVar[str] = "Counts NULL values in a specific column"
-    sql_template: ClassVar[str] = """
-SELECT
-    '{{ check_name }}' AS check_name,
-    COUNTIF({{ column_name }} IS NULL) AS value
-FROM cte_{{ suite_name }}_base
-    """
+    aggregate_template: ClassVar[str] = "COUNTIF({{ column_name }} IS NULL)"
     required_params: ClassVar[List[str]] = ["column_name"]
\ No newline at end of file
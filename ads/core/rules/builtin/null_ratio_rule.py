@@ -10,11 +10,5 @@ class NullRatioRule(RuleTemplateBase):
 
     name: ClassVar[str] = "null_ratio"
     description: ClassVar[str] = "Computes ratio of NULL values to total records."
-    sql_template: ClassVar[str] = """
-SELECT 
-    '{{ check_name }}' AS check_name,
-    SAFE_DIVIDE(COUNTIF({{ column_name }} IS NULL), COUNT(*)) AS value
-FROM
-    cte_{{ suite_name }}_base
-    """
+    aggregate_template: ClassVar[str] = "SAFE_DIVIDE(COUNTIF({{ column_name }} IS NULL), COUNT(*))"
     required_params: ClassVar[List[str]] = ["column_name"]
\ No newline at end of file
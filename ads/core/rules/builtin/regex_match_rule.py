@@ -10,11 +10,5 @@ class RegexMatchRule(RuleTemplateBase):
 
     name: ClassVar[str] = "regex_match"
     description: ClassVar[str] = "Counts values not matching regex pattern."
-    sql_template: ClassVar[str] = """
-SELECT 
-    '{{ check_name }}' AS check_name,
-    COUNTIF(REGEXP_CONTAINS({{ column_name }}, r'{{ regex_pattern }}') = FALSE) AS value
-FROM
-    cte_{{ suite_name }}_base
-    """
+    aggregate_template: ClassVar[str] = "COUNTIF(NOT REGEXP_CONTAINS({{ column_name }}, r'{{ regex_pattern }}'))"
     required_params: ClassVar[List[str]] = ["column_name", "regex_pattern"]
\ No newline at end of file
@@ -10,11 +10,5 @@ class ValueRangeRule(RuleTemplateBase):
 
     name: ClassVar[str] = "value_range"
     description: ClassVar[str] = "Checks if numeric values fall within a specified range."
-    sql_template: ClassVar[str] = """
-SELECT
-    '{{ check_name }}' AS check_name,
-    COUNTIF({{ column_name }} < {{ lower_bound }} OR {{ column_name }} > {{ upper_bound }}) AS value
-FROM
-    cte_{{ suite_name }}_base
-    """
+    aggregate_template: ClassVar[str] = "COUNTIF({{ column_name }} < {{ lower_bound }} OR {{ column_name }} > {{ upper_bound }})"
     required_params: ClassVar[List[str]] = ["column_name", "lower_bound", "upper_bound"]
\ No newline at end of file
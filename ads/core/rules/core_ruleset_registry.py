@@ -1,5 +1,5 @@
 import re
-from typing import List, Any, Dict, Type
+from typing import Any, ClassVar, List
 
 from ads.core.base import AdsBase
 from ads.core.rules.builtin.accepted_values_rule import AcceptedValuesRule
@@ -14,53 +14,56 @@ from ads.core.rules.builtin.regex_match_rule import RegexMatchRule
 from ads.core.rules.builtin.row_count_rule import RowCountRule
 from ads.core.rules.builtin.unique_rule import UniqueRule
 from ads.core.rules.builtin.value_range_rule import ValueRangeRule
+from ads.core.rules.rule_template_base import ReadOnlyParams
 
 
 class CoreRulesetRegistry(AdsBase):
     """Registry for all built-in rule templates."""
-    
-    @property
-    def not_null(self) -> NotNullRule:
-        return NotNullRule()
 
-    @property
-    def unique(self) -> UniqueRule:
-        return UniqueRule()
-
-    @property
-    def row_count(self) -> RowCountRule:
-        return RowCountRule()
-
-    @property
-    def negative_values(self) -> NegativeValuesRule:
-        return NegativeValuesRule()
-
-    @property
-    def constant_column(self) -> ConstantColumnRule:
-        return ConstantColumnRule()
-
-    @property
-    def null_ratio(self) -> NullRatioRule:
-        return NullRatioRule()
+    # Parameterless rules are stateless, a single shared instance per rule is enough
+    # (with read-only params, so no check can change the rule of every other check)
+    not_null: ClassVar[NotNullRule] = NotNullRule.model_construct(params=ReadOnlyParams())
+    unique: ClassVar[UniqueRule] = UniqueRule.model_construct(params=ReadOnlyParams())
+    row_count: ClassVar[RowCountRule] = RowCountRule.model_construct(params=ReadOnlyParams())
+    negative_values: ClassVar[NegativeValuesRule] = NegativeValuesRule.model_construct(params=ReadOnlyParams())
+    constant_column: ClassVar[ConstantColumnRule] = ConstantColumnRule.model_construct(params=ReadOnlyParams())
+    null_ratio: ClassVar[NullRatioRule] = NullRatioRule.model_construct(params=ReadOnlyParams())
 
+    # Parameterized rules are built from trusted, already typed arguments, so validation is skipped
     def regex_match(self, regex_pattern: re.Pattern[str]) -> RegexMatchRule:
-        return RegexMatchRule(params={"regex_pattern": regex_pattern})
+        return RegexMatchRule.model_construct(params={"regex_pattern": regex_pattern})
 
     def duplicated_rows(self, column_names: List[str]) -> DuplicateRowsRule:
-        return DuplicateRowsRule(params={"column_names": column_names})
+        return DuplicateRowsRule.model_construct(params={"column_names": column_names})
 
     def freshness(self, granularity: FreshnessGranularity = FreshnessGranularity.HOUR) -> FreshnessRule:
-        return FreshnessRule(params={"granularity": granularity.value})
+        return FreshnessRule.model_construct(params={"granularity": granularity.value})
 
     def referential_integrity(self, reference_table: str, reference_column: str) -> ReferentialIntegrityRule:
-        return ReferentialIntegrityRule(
+        return ReferentialIntegrityRule.model_construct(
             params={"reference_table": reference_table, "reference_column": reference_column}
         )
 
     def accepted_values(self, accepted_values: List[Any]) -> AcceptedValuesRule:
-        return AcceptedValuesRule(params={"accepted_values": accepted_values})
+        return AcceptedValuesRule.model_construct(params={"accepted_values": accepted_values})
 
     def value_range(self, lower_bound: float, upper_bound: float) -> ValueRangeRule:
-        return ValueRangeRule(params={"upper_bound": upper_bound, "lower_bound": lower_bound})
+        return ValueRangeRule.model_construct(params={"upper_bound": upper_bound, "lower_bound": lower_bound})
+
+# Registry attribute name -> rule class, used to build name lookups without attribute probing
+CORE_RULES_TABLE = {
+    "not_null": NotNullRule,
+    "unique": UniqueRule,
+    "row_count": RowCountRule,
+    "negative_values": NegativeValuesRule,
+    "constant_column": ConstantColumnRule,
+    "null_ratio": NullRatioRule,
+    "regex_match": RegexMatchRule,
+    "duplicated_rows": DuplicateRowsRule,
+    "freshness": FreshnessRule,
+    "referential_integrity": ReferentialIntegrityRule,
+    "accepted_values": AcceptedValuesRule,
+    "value_range": ValueRangeRule,
+}
 
 core_ruleset = CoreRulesetRegistry()
\ No newline at end of file
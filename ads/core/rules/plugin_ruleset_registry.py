@@ -1,8 +1,9 @@
 import importlib
+import importlib.metadata
 import inspect
 import pkgutil
 from types import ModuleType
-from typing import List, Any, Dict, Type
+from typing import Any, Dict, Type
 
 from ads.core.base import AdsBase
 from ads.core.rules.rule_template_base import RuleTemplateBase
@@ -12,8 +13,10 @@ class PluginRulesetRegistry(AdsBase):
     """
     Dynamic registry for all plugin rule templates.
 
-    Automatically discovers and loads rule classes defined under
-    ads.plugins.rules.*, registering them by their `name` attribute.
+    Loads rule classes registered under the `ads.plugins.rules` entry-point group
+    (see pyproject.toml). When no entry points are installed (e.g. running from a source checkout),
+    falls back to discovering rule classes defined under ads.plugins.rules.*.
+    Rules are registered by their `name` attribute.
 
     Example:
         plugin_rules = PluginRulesetRegistry()
@@ -21,12 +24,23 @@ class PluginRulesetRegistry(AdsBase):
         plugin_rule.render(helpers, {"column_name": "customer_id"})
     """
 
+    ENTRY_POINT_GROUP = "ads.plugins.rules"
+
     def __init__(self):
         self._rules = {}
-        self._load_builtin_rules()
+        if not self._load_entry_point_rules():
+            self._load_builtin_rules()
+
+    def _load_entry_point_rules(self) -> bool:
+        """Registers the rule classes declared in the entry-point group, returns False if none are declared."""
+        entry_points = importlib.metadata.entry_points(group=self.ENTRY_POINT_GROUP)
+        for entry_point in entry_points:
+            rule_cls = entry_point.load()
+            self._rules[getattr(rule_cls, "name", entry_point.name).lower()] = rule_cls
+        return bool(entry_points)
 
     def _load_builtin_rules(self) -> None:
-        """Dynamically import and register all rule classes under plugins/rules/"""
+        """Dynamically import and register all rule classes under plugins/rules/ (filesystem scan fallback)"""
         import ads.plugins.rules as plugin_pkg
 
         for module_info in pkgutil.iter_modules(plugin_pkg.__path__, plugin_pkg.__name__ + "."):
@@ -55,6 +69,9 @@ class PluginRulesetRegistry(AdsBase):
         """Returns a dictionary of all available rule names and their classes."""
         return dict(self._rules)
 
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._rules
+
     def __getitem__(self, name: str) -> RuleTemplateBase:
         """Shortcut for ruleset['not_null'] access."""
         return self.get(name)
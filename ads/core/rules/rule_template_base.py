@@ -1,10 +1,177 @@
-from typing import Optional, Dict, Any, ClassVar, List
+import functools
+import keyword
+import re
+from typing import Optional, Dict, Any, ClassVar, List, FrozenSet, Hashable, Tuple, Union
 
+import jinja2
 from pydantic import Field, BaseModel, ConfigDict
 
 from ads.core.base import AdsBase
 from ads.core.rules.exceptions import RuleParameterError
 from ads.helpers.helper_library import HelperLibrary
+from ads.helpers.string_helper import BYTECODE_CACHE, compile_template_source
+
+# Shared, minimal environment for all rule templates (SQL, so no HTML autoescaping and no extensions).
+# StrictUndefined makes rendering fail on any unresolved variable instead of leaving it in the SQL,
+# trim_blocks/lstrip_blocks keep block tags ({% if %}, {% for %}) from leaking whitespace into the SQL
+_JINJA_ENV = jinja2.Environment(undefined=jinja2.StrictUndefined,
+                                autoescape=False,
+                                extensions=(),
+                                trim_blocks=True,
+                                lstrip_blocks=True,
+                                keep_trailing_newline=False,
+                                line_statement_prefix=None,
+                                auto_reload=False,
+                                optimized=True,
+                                cache_size=-1,
+                                bytecode_cache=BYTECODE_CACHE)
+
+
+# Plain `{{ name }}` substitutions, the only Jinja syntax the generated-function fast path supports
+_SUBSTITUTION_RE = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+
+# Catch-all keyword parameter of the generated render functions (absorbs parameters the template does not use)
+_EXTRA_PARAMS_NAME = "_extra_params"
+
+
+class _FormatTemplate:
+    """
+    Stand-in for a compiled Jinja template made only of `{{ name }}` substitutions.
+
+    The template is turned into a generated Python function returning a single f-string
+    (`def render(*, column_name, **_extra_params): return f'...{column_name}...'`), so rendering is one call.
+    Renders exactly like `_JINJA_ENV` would (str() of each value, one trailing newline dropped)
+    and raises jinja2.UndefinedError for missing variables, so callers handle both template kinds alike.
+    """
+
+    __slots__ = ("_function", "_names")
+
+    def __init__(self, body: str, names: Tuple[str, ...]):
+        self._names = names
+        # Only the f-string body comes from the template: the literal text is embedded through repr()
+        # and the substituted names are identifiers matched by _SUBSTITUTION_RE (keywords excluded)
+        arguments = "".join(f"{name}, " for name in names)
+        code = f"def render(*, {arguments}**{_EXTRA_PARAMS_NAME}):\n    return f{body!r}\n"
+        namespace: Dict[str, Any] = {}
+        exec(compile(code, "<rule_template>", "exec"), namespace)
+        self._function = namespace["render"]
+
+    @classmethod
+    def from_source(cls, source: str) -> Optional["_FormatTemplate"]:
+        """Converts a Jinja source into a render function, None when it uses anything beyond plain substitutions."""
+        # Same as keep_trailing_newline=False, carriage returns are left to Jinja's newline normalization
+        if "\r" in source:
+            return None
+        if source.endswith("\n"):
+            source = source[:-1]
+        parts: List[str] = []
+        position = 0
+        for match in _SUBSTITUTION_RE.finditer(source):
+            parts.append(source[position:match.start()])
+            parts.append(match.group(1))
+            position = match.end()
+        parts.append(source[position:])
+        texts = parts[::2]
+        if any("{{" in text or "{%" in text or "{#" in text for text in texts):
+            return None
+        names = tuple(dict.fromkeys(parts[1::2]))
+        if any(keyword.iskeyword(name) or name == _EXTRA_PARAMS_NAME for name in names):
+            return None
+        # Literal braces are escaped, substitutions become f-string fields
+        return cls(body="".join(
+            "{" + part + "}" if i % 2 else part.replace("{", "{{").replace("}", "}}")
+            for i, part in enumerate(parts)
+        ), names=names)
+
+    def render(self, params: Dict[str, Any]) -> str:
+        try:
+            return self._function(**params)
+        except TypeError:
+            missing = [name for name in self._names if name not in params]
+            if missing:
+                raise jinja2.UndefinedError(f"'{missing[0]}' is undefined") from None
+            raise
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_sql_template(sql_template: str) -> Union[jinja2.Template, _FormatTemplate]:
+    """
+    Compiles a rule SQL template once, subsequent renders reuse the compiled template.
+
+    Templates made only of `{{ name }}` substitutions (most rules) skip Jinja and render through a generated f-string function.
+    """
+    return (_FormatTemplate.from_source(sql_template)
+            or compile_template_source(env=_JINJA_ENV, source=sql_template, namespace="rule_template"))
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Converts a parameter value into a hashable key.
+
+    Types are kept in the key, so values that compare equal but render differently
+    (1 / 1.0 / True, [1] / (1,)) never share a cache entry. Raises TypeError for unhashable leaves.
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze(v) for v in value)
+    hash(value)
+    return type(value), value
+
+
+class ReadOnlyParams(dict):
+    """
+    Rule parameters that cannot be modified in place.
+
+    Used by rule instances shared across checks and suites (see `CoreRulesetRegistry`), where an in-place
+    update would leak into every other check using the instance. Still a dict for rendering and serialization.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Parameters of a shared rule instance are read-only, create a new rule instance instead")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> Any:
+        # copy/deepcopy/pickle rebuild from a plain dict instead of item assignment
+        return type(self), (dict(self),)
+
+
+class _FrozenParams:
+    """Render parameters hashed/compared by their frozen form, while keeping the original values for rendering."""
+
+    __slots__ = ("params", "_key", "_hash")
+
+    def __init__(self, params: Dict[str, Any]):
+        self.params = params
+        self._key = _freeze(params)
+        self._hash = hash(self._key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _FrozenParams) and self._key == other._key
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_cached(template: Union[jinja2.Template, _FormatTemplate], params: _FrozenParams) -> str:
+    """Renders a compiled rule template once per distinct set of parameters."""
+    return template.render(params.params)
+
+
+def _aggregate_sql_template(aggregate_template: str) -> str:
+    """Wraps a single aggregate expression into a standalone rule SQL template over the base CTE."""
+    return ("\nSELECT\n"
+            "    '{{ check_name }}' AS check_name,\n"
+            f"    {aggregate_template.strip()} AS value\n"
+            "FROM\n"
+            "    cte_{{ suite_name }}_base\n")
 
 
 class RuleTemplateBase(BaseModel, AdsBase):
@@ -25,26 +192,63 @@ class RuleTemplateBase(BaseModel, AdsBase):
                                              description="Default parameters for the rule template.")
     required_params: ClassVar[List[str]] = []
 
+    # Optional: single aggregate expression over the base CTE, e.g. "COUNTIF({{ column_name }} IS NULL)".
+    # Rules defining it get their `sql_template` derived from it, and the SQLBuilder can fuse them
+    # with other aggregate rules of the suite into a single scan of the base CTE.
+    aggregate_template: ClassVar[Optional[str]] = None
+
+    # Compiled templates and frozen `required_params`, set once per rule class at class creation
+    _compiled_template: ClassVar[Optional[Union[jinja2.Template, _FormatTemplate]]] = None
+    _compiled_aggregate: ClassVar[Optional[Union[jinja2.Template, _FormatTemplate]]] = None
+    _required_frozen: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Compiles the rule's SQL templates and freezes its required parameters once, when the rule class is defined."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._required_frozen = frozenset(cls.required_params)
+        aggregate_template = cls.__dict__.get("aggregate_template")
+        if isinstance(aggregate_template, str):
+            cls._compiled_aggregate = _compile_sql_template(aggregate_template)
+            if "sql_template" not in cls.__dict__:
+                cls.sql_template = _aggregate_sql_template(aggregate_template)
+        sql_template = cls.__dict__.get("sql_template")
+        if isinstance(sql_template, str):
+            cls._compiled_template = _compile_sql_template(sql_template)
+
     def render(self, helpers: HelperLibrary, extra_params: Optional[Dict[str, Any]]) -> str:
         """Renders the SQL with given parameters."""
+        # Rules whose template was not available at class creation go through the template cache
+        template = self._compiled_template or _compile_sql_template(self.sql_template)
+        return self._render_template(template=template, extra_params=extra_params)
+
+    def render_aggregate(self, helpers: HelperLibrary, extra_params: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Renders the rule's aggregate expression with given parameters, None if the rule defines none."""
+        if self._compiled_aggregate is None:
+            return None
+        return self._render_template(template=self._compiled_aggregate, extra_params=extra_params)
+
+    def _render_template(self, template: Union[jinja2.Template, _FormatTemplate], extra_params: Optional[Dict[str, Any]]) -> str:
+        """Validates the combined parameters and renders the given compiled template (memoized per parameters)."""
         combined_params = {**(self.params or {}), **(extra_params or {})}
         self._validate_required_params(params=combined_params)
-        rendered_sql = helpers.string.render_jinja_template(
-            value=self.sql_template,
-            params=combined_params,
-            keep_undefined_as_is=True
-        )
-
-        # region Fail-safe validation in final SQL script to check unresolved Jinja variables
-        if "{{" in rendered_sql or "}}" in rendered_sql:
-            raise RuleParameterError(rule_name=self.name, missing_params=["unresolved Jinja variables"])
-        # endregion
 
-        return rendered_sql
+        try:
+            try:
+                frozen_params = _FrozenParams(combined_params)
+            except TypeError:  # unhashable parameter values, render without the cache
+                return template.render(combined_params)
+            return _render_cached(template, frozen_params)
+        except jinja2.UndefinedError as e:
+            raise RuleParameterError(rule_name=self.name, missing_params=[e.message]) from e
 
     def _validate_required_params(self, params: Dict[str, Any]) -> None:
         """Checks that all required parameters are present and non-None."""
-        missing_params = [p for p in getattr(self, "required_params", []) if not params.get(p)]
+        required_params = self._required_frozen
+        if not required_params:
+            return
+        # Only absent/None values are missing, falsy values such as 0, False or "" are valid
+        missing_params = sorted(p for p in required_params if params.get(p) is None)
         if missing_params:
             raise RuleParameterError(rule_name=getattr(self, "name", "unknown"),
                                      missing_params=missing_params)
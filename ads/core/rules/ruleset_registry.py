@@ -1,5 +1,5 @@
 from ads.core.base import AdsBase
-from ads.core.rules.core_ruleset_registry import CoreRulesetRegistry
+from ads.core.rules.core_ruleset_registry import CoreRulesetRegistry, CORE_RULES_TABLE
 from ads.core.rules.plugin_ruleset_registry import PluginRulesetRegistry
 from ads.core.rules.rule_template_base import RuleTemplateBase
 
@@ -11,6 +11,11 @@ class RulesetRegistry(AdsBase):
         self._core = CoreRulesetRegistry()
         self._plugins = PluginRulesetRegistry()
 
+        # Core rules resolvable by registry attribute name and by rule name (e.g. "duplicated_rows" / "duplicate_rows")
+        self._name_index = {attr: getattr(self._core, attr) for attr in CORE_RULES_TABLE}
+        for attr, rule_cls in CORE_RULES_TABLE.items():
+            self._name_index.setdefault(rule_cls.name, self._name_index[attr])
+
     @property
     def core(self) -> CoreRulesetRegistry:
         return self._core
@@ -20,8 +25,9 @@ class RulesetRegistry(AdsBase):
         return self._plugins
 
     def get(self, rule_name: str) -> RuleTemplateBase:
-        if hasattr(self._core, rule_name):
-            return getattr(self._core, rule_name)
+        rule = self._name_index.get(rule_name)
+        if rule is not None:
+            return rule
         if rule_name in self._plugins:
             return self._plugins.get(name=rule_name)
         raise KeyError(f"Rule '{rule_name}' not found in core or plugin registry")
@@ -1,14 +1,21 @@
-from typing import Optional, List, Dict, Any, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
 from ads.core.base import AdsBase
 from ads.core.engine.executor import Executor
 from ads.core.engine.result_parser import ResultParser
 from ads.core.engine.sql_builder import SQLBuilder
-from ads.core.enums import ResultExportType, CheckStatus, Severity
+from ads.core.enums import ResultExportType, SuiteRunStatus
 from ads.core.exporters.exporter_registry import ExporterRegistry
 from ads.core.models import Suite, Result, ResultsMetadata
 from ads.helpers.helper_library import HelperLibrary
 
+_FAILED_RUN_STATUSES = frozenset((SuiteRunStatus.FAILED, SuiteRunStatus.VALIDATION_FAILED))
+
 
 class SentinelRunner(AdsBase):
     """
@@ -22,17 +29,24 @@ class SentinelRunner(AdsBase):
         - Optionally export or persist results (e.g., JSON, SQLite, Prometheus)
     """
 
+    # Compiled SQL is a pure function of the suite definition, kept per suite fingerprint (LRU)
+    SQL_CACHE_MAX_SIZE = 256
+
+    # Maximum number of concurrent per-check dry-runs (network bound, the GIL is released while waiting)
+    PARALLEL_VALIDATE_MAX_WORKERS = 8
+
     def __init__(self,
                  project_id: str,
                  location: Optional[str] = None):
         super().__init__()
-        self._helpers = HelperLibrary()
         self._project_id = project_id
         self._location = location
-        self._executor = Executor(project_id=project_id,
-                                  helpers=self._helpers,
-                                  location=location)
+        # Created on first execution, compiling SQL does not need it
+        self._executor: Optional[Executor] = None
         self._result_parser = ResultParser()
+        self._exporter_registry = ExporterRegistry()
+        self._sql_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._sql_cache_lock = threading.Lock()
 
     @property
     def project_id(self) -> str:
@@ -42,46 +56,257 @@ class SentinelRunner(AdsBase):
     def helpers(self) -> HelperLibrary:
         return self._helpers
 
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = Executor(project_id=self.project_id,
+                                      helpers=self.helpers,
+                                      location=self.location)
+        return self._executor
+
     @property
     def location(self) -> Optional[str]:
         return self._location
 
     def run_suite(self,
                   suite: Suite,
-                  validate_first: Optional[bool] = True,
-                  validate_only: Optional[bool] = False,
-                  flatten_results: Optional[bool] = False,
-                  extra: Optional[Dict[str, Any]] = None) -> Tuple[ResultsMetadata, List[Result]]:
+                  validate_first: bool = True,
+                  validate_only: bool = False,
+                  flatten_results: bool = False,
+                  extra: Optional[Dict[str, Any]] = None,
+                  parallel_validate: bool = False) -> Tuple[ResultsMetadata, List[Result]]:
         """
         Compiles and executes all checks within a Suite.
 
         Steps:
             1. Build unified SQL (SQLBuilder)
-            2. Dry-run to validate
+            2. Dry-run to validate when `validate_first`/`validate_only` (per check and in parallel when
+               `parallel_validate`, any invalid check fails the run with VALIDATION_FAILED before the suite is executed)
             3. Execute full query
             4. Parse results into structured Result objects
         """
 
-        # region Prepare the SQL and execute
-        builder = SQLBuilder(suite=suite, helpers=self.helpers)
-        sql_query = builder.build()
+        # region Validate every check on its own (reports all invalid checks at once, not only the first error)
+        # Only when validation is requested at all, `parallel_validate` picks how, not whether
+        if parallel_validate and (validate_first or validate_only):
+            validation_metadata = self._validate_checks(suite=suite,
+                                                        validate_first=validate_first,
+                                                        validate_only=validate_only,
+                                                        extra=extra)
+            if validation_metadata is not None:
+                return validation_metadata, []
+        # endregion
+
+        # region Prepare the SQL and execute (a single statement unless the suite exceeds BigQuery's query length limit)
+        sql_queries = self._build_sql_batches(suite=suite)
 
-        metadata, rows = self._executor.execute(
+        metadata, rows = self.executor.execute(
             suite=suite,
-            sql_query=sql_query,
+            sql_query=sql_queries[0],
             flatten_results=flatten_results,
             validate_first=validate_first,
             validate_only=validate_only,
             extra=extra
         )
+        batch_metadatas: List[ResultsMetadata] = []
+        for sql_query in sql_queries[1:]:
+            batch_metadata, batch_rows = self.executor.execute(
+                suite=suite,
+                sql_query=sql_query,
+                flatten_results=flatten_results,
+                validate_first=validate_first,
+                validate_only=validate_only,
+                extra=extra
+            )
+            batch_metadatas.append(batch_metadata)
+            rows = chain(rows, batch_rows)
         # endregion
 
-        # region Parse results
-        results = self._result_parser.parse(suite=suite, rows=rows)
+        # region Parse results (dry-runs return no rows, nothing to parse)
+        results = [] if validate_only else self._result_parser.parse(suite=suite, rows=rows)
         # endregion
 
+        # Merged once the rows are consumed, a batch whose page fetch failed is FAILED only by then
+        for batch_metadata in batch_metadatas:
+            self._merge_batch_metadata(metadata=metadata, batch_metadata=batch_metadata)
+
         return metadata, results
 
+    def run_suites(self,
+                   suites: List[Suite],
+                   validate_first: bool = True,
+                   validate_only: bool = False,
+                   flatten_results: bool = False,
+                   extra: Optional[Dict[str, Any]] = None) -> List[Tuple[ResultsMetadata, List[Result]]]:
+        """
+        Compiles and executes several suites in as few BigQuery jobs as possible.
+
+        Each suite is wrapped as a subquery tagged with its name (SQLBuilder.wrap_as_subquery), the subqueries are
+        combined with UNION ALL into statements under BigQuery's query length limit, and the rows of each job are
+        demultiplexed by suite name before parsing. Suites that end up alone in a statement (or are too long to
+        be combined) run through `run_suite`, reusing their already compiled SQL.
+
+        Returns:
+            - List of (metadata, results) tuples, in the same order as `suites`. Suites sharing a job share its
+              job statistics, `extra["batched_suites"]` lists the suites of that job.
+        """
+        suite_names = [suite.name for suite in suites]
+        if len(set(suite_names)) != len(suite_names):
+            raise ValueError("Suite names must be unique within run_suites, rows are demultiplexed by suite name")
+
+        outcomes: Dict[str, Tuple[ResultsMetadata, List[Result]]] = {}
+        for group in self._group_suite_subqueries(suites=suites):
+            if len(group) == 1:
+                outcomes[group[0][0].name] = self.run_suite(suite=group[0][0],
+                                                            validate_first=validate_first,
+                                                            validate_only=validate_only,
+                                                            flatten_results=flatten_results,
+                                                            extra=extra)
+                continue
+
+            metadata, rows = self.executor.execute(
+                suite=group[0][0],
+                sql_query=SQLBuilder.UNION_SEPARATOR.join(SQLBuilder.wrap_as_subquery(suite_name=suite.name, sql_query=sql_query)
+                                                          for suite, sql_query in group),
+                flatten_results=flatten_results,
+                validate_first=validate_first,
+                validate_only=validate_only,
+                extra=extra
+            )
+
+            # region Demultiplex rows per suite
+            rows_by_suite: Dict[str, List[Dict[str, Any]]] = {suite.name: [] for suite, _ in group}
+            for row in rows:
+                suite_rows = rows_by_suite.get(row.get(SQLBuilder.SUITE_NAME_COLUMN))
+                if suite_rows is not None:
+                    suite_rows.append(row)
+            # endregion
+
+            batched_suites = [suite.name for suite, _ in group]
+            for suite, _ in group:
+                suite_metadata = ResultsMetadata(**{
+                    **dict(metadata),
+                    "suite_name": suite.name,
+                    "suite_description": suite.description,
+                    "errors": list(metadata.errors or []),
+                    "extra": {**(metadata.extra or {}), "batched_suites": batched_suites}
+                })
+                results = [] if validate_only else self._result_parser.parse(suite=suite, rows=rows_by_suite[suite.name])
+                outcomes[suite.name] = (suite_metadata, results)
+
+        return [outcomes[name] for name in suite_names]
+
+    def _group_suite_subqueries(self, suites: List[Suite]) -> List[List[Tuple[Suite, str]]]:
+        """
+        Groups the suites' compiled statements into UNION ALL statements kept under SQLBuilder.MAX_QUERY_LENGTH.
+
+        Statements come from the same cache as `run_suite`, so suites run alone are not compiled twice.
+        They are wrapped as subqueries (SQLBuilder.wrap_as_subquery) only once combined.
+        """
+        max_query_length = SQLBuilder.MAX_QUERY_LENGTH
+        separator_length = len(SQLBuilder.UNION_SEPARATOR)
+        groups: List[List[Tuple[Suite, str]]] = [[]]
+        group_length = 0
+
+        for suite in suites:
+            sql_queries = self._build_sql_batches(suite=suite)
+            subquery_length = len(sql_queries[0]) + len(SQLBuilder.wrap_as_subquery(suite_name=suite.name, sql_query=""))
+            # Too long to be combined, run_suite executes its batch(es) on its own
+            if len(sql_queries) > 1 or subquery_length > max_query_length:
+                groups.append([(suite, sql_queries[0])])
+                groups.append([])
+                group_length = 0
+                continue
+            if groups[-1] and group_length + separator_length + subquery_length > max_query_length:
+                groups.append([])
+                group_length = 0
+            groups[-1].append((suite, sql_queries[0]))
+            group_length += separator_length + subquery_length
+
+        return [group for group in groups if group]
+
+    def _validate_checks(self,
+                         suite: Suite,
+                         validate_first: bool,
+                         validate_only: bool,
+                         extra: Optional[Dict[str, Any]]) -> Optional[ResultsMetadata]:
+        """Dry-runs each check's standalone SQL concurrently, returns failed run metadata if any check is invalid."""
+        started_at = time.time()
+        statements = SQLBuilder(suite=suite, helpers=self.helpers).build_check_statements()
+        if not statements:
+            return None
+
+        errors: Dict[str, str] = {}
+        max_workers = min(self.PARALLEL_VALIDATE_MAX_WORKERS, len(statements))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ads-validate") as pool:
+            futures = {pool.submit(self.executor.dry_run, sql_query=sql_query): check_name
+                       for check_name, sql_query in statements.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[futures[future]] = str(e)
+
+        if not errors:
+            return None
+
+        ended_at = time.time()
+        return ResultsMetadata(
+            suite_name=suite.name,
+            suite_description=suite.description,
+            validate_first=validate_first,
+            validate_only=validate_only,
+            started_at=started_at,
+            ended_at=ended_at,
+            duration_ms=round((ended_at - started_at) * 1000, 2),
+            status=SuiteRunStatus.VALIDATION_FAILED,
+            # Reported in suite check order, independent of dry-run completion order
+            errors=[f"{check_name}: {errors[check_name]}" for check_name in statements if check_name in errors],
+            extra=extra
+        )
+
+    def _build_sql_batches(self, suite: Suite) -> List[str]:
+        """Returns the compiled SQL statement(s) of the suite, compiling only on a cache miss."""
+        return self._cached_sql(key=suite.fingerprint(),
+                                build=lambda: SQLBuilder(suite=suite, helpers=self.helpers).build_batches())
+
+    def _cached_sql(self, key: str, build: Callable[[], List[str]]) -> List[str]:
+        """Returns the cached SQL statement(s) for the key, calling `build` only on a cache miss."""
+        with self._sql_cache_lock:
+            cached = self._sql_cache.get(key)
+            if cached is not None:
+                self._sql_cache.move_to_end(key)
+                return cached
+
+        sql_queries = build()
+
+        with self._sql_cache_lock:
+            self._sql_cache[key] = sql_queries
+            while len(self._sql_cache) > self.SQL_CACHE_MAX_SIZE:
+                self._sql_cache.popitem(last=False)
+        return sql_queries
+
+    def clear_sql_cache(self) -> None:
+        """Drops all cached compiled suite SQL (e.g. after plugin rule templates changed)."""
+        with self._sql_cache_lock:
+            self._sql_cache.clear()
+
+    @staticmethod
+    def _merge_batch_metadata(metadata: ResultsMetadata, batch_metadata: ResultsMetadata) -> None:
+        """Folds the metadata of an additional batch statement into the suite run metadata."""
+        metadata.ended_at = batch_metadata.ended_at
+        metadata.duration_ms = (metadata.duration_ms or 0) + (batch_metadata.duration_ms or 0)
+        if batch_metadata.bytes_processed is not None:
+            metadata.bytes_processed = (metadata.bytes_processed or 0) + batch_metadata.bytes_processed
+        metadata.cache_hit = bool(metadata.cache_hit and batch_metadata.cache_hit)
+        metadata.errors = [*(metadata.errors or []), *(batch_metadata.errors or [])]
+        metadata.extra = {
+            **(metadata.extra or {}),
+            "batch_job_ids": [*(metadata.extra or {}).get("batch_job_ids", [metadata.job_id]), batch_metadata.job_id]
+        }
+        # A failed batch fails the whole suite run
+        if batch_metadata.status in _FAILED_RUN_STATUSES:
+            metadata.status = batch_metadata.status
 
     def run_check(self, suite: Suite, check_name: str) -> Optional[Result]:
         """
@@ -99,16 +324,19 @@ class SentinelRunner(AdsBase):
         """
         Exports a list of Result objects to the specified format.
 
-        Supported formats (MVP):
+        Supported formats:
             - JSON (default)
-            - SQLite (planned)
-            - Prometheus (planned)
+            - CSV
+            - SQLite
+            - Prometheus
+            - HTML
+            - MessagePack (requires the optional `msgpack` package)
         """
-        exporter = ExporterRegistry().get(export_type=export_type)
+        exporter = self._exporter_registry.get(export_type=export_type)
         exported_path = exporter.export(metadata=metadata,
                                         results=results,
                                         destination=destination)
         self.logger.info(f"Export completed: {export_type.name} → {exported_path}")
 
     def __repr__(self):
-        return f"<SentinelRunner project='{self.project_id}' location='{self.location}'"
\ No newline at end of file
+        return f"<SentinelRunner project='{self._project_id}' location='{self._location}'>"
\ No newline at end of file
@@ -1,7 +1,18 @@
-from typing import Optional
+from enum import Enum
+from typing import Any, Optional
+
+_MISSING = object()
 
 
 class EnumHelper:
 
-    def get_value(self, enum_value, default_value: Optional[str] = None):
-        return getattr(enum_value, "value", str(default_value or str(enum_value)))
\ No newline at end of file
+    __slots__ = ()
+
+    def get_value(self, enum_value, default_value: Optional[str] = None) -> Any:
+        # Enum members (the common case) resolve with a single type check, the string fallback is built only when needed
+        if isinstance(enum_value, Enum):
+            return enum_value.value
+        value = getattr(enum_value, "value", _MISSING)
+        if value is not _MISSING:
+            return value
+        return str(default_value) if default_value else str(enum_value)
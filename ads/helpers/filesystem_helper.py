@@ -1,10 +1,15 @@
+import os
 from pathlib import Path
 
 
 class FileSystemHelper:
 
+    __slots__ = ()
+
     def create_parent_directories(self, path: Path) -> Path:
-        path.mkdir(parents=True, exist_ok=True)
+        # One stat for the common case of an existing directory (mkdir with exist_ok also fails with EEXIST first)
+        if not os.path.isdir(path):
+            path.mkdir(parents=True, exist_ok=True)
         return path
 
     def file_exists(self, path: Path) -> bool:
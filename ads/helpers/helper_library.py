@@ -1,25 +1,29 @@
 from ads.helpers.enum_helper import EnumHelper
 from ads.helpers.filesystem_helper import FileSystemHelper
+from ads.helpers.json_helper import JsonHelper
 from ads.helpers.string_helper import StringHelper
 
 
 class HelperLibrary:
     """Combined library of all the helper classes"""
 
+    __slots__ = ("_string_helper", "_enum_helper", "_filesystem_helper", "_json_helper")
+
     _global_instance = None
 
     def __init__(self):
         self._string_helper = StringHelper()
         self._enum_helper = EnumHelper()
         self._filesystem_helper = FileSystemHelper()
+        self._json_helper = JsonHelper()
 
     @classmethod
-    def global_instance(cls):
+    def global_instance(cls) -> "HelperLibrary":
+        """Process-wide shared instance (all helpers are stateless)"""
         if cls._global_instance is None:
             cls._global_instance = cls()
         return cls._global_instance
 
-
     @property
     def string(self) -> StringHelper:
         return self._string_helper
@@ -30,4 +34,8 @@ class HelperLibrary:
 
     @property
     def filesystem(self) -> FileSystemHelper:
-        return self._filesystem_helper
\ No newline at end of file
+        return self._filesystem_helper
+
+    @property
+    def json(self) -> JsonHelper:
+        return self._json_helper
\ No newline at end of file
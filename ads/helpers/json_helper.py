@@ -0,0 +1,57 @@
+import dataclasses
+import datetime
+import json
+from enum import Enum
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional dependency, see the `fast-json` extra
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Serializes the non-JSON types found in export payloads (enums, dataclasses, datetimes)."""
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, datetime.datetime):
+        # Naive datetimes are UTC, same as orjson's OPT_NAIVE_UTC
+        return (value if value.tzinfo else value.replace(tzinfo=datetime.timezone.utc)).isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonHelper:
+    """
+    JSON serialization utilities.
+
+    Uses `orjson` when it is installed and falls back to the stdlib `json` module otherwise.
+    Output is always compact UTF-8 (no ASCII escaping) unless an indent is requested.
+    Enums are written as their value, dataclasses as objects and naive datetimes as UTC.
+    """
+
+    __slots__ = ()
+
+    ORJSON_AVAILABLE = orjson is not None
+
+    def dumps_bytes(self, value: Any, indent: Optional[int] = None) -> bytes:
+        """Serializes `value` into UTF-8 encoded JSON bytes."""
+        # orjson only supports 2-space indentation, other indents go through the stdlib encoder
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(value, default=_default, option=option)
+        return self._stdlib_dumps(value, indent).encode("utf-8")
+
+    def dumps(self, value: Any, indent: Optional[int] = None) -> str:
+        """Serializes `value` into a JSON string."""
+        if orjson is not None and indent in (None, 2):
+            return self.dumps_bytes(value, indent).decode("utf-8")
+        return self._stdlib_dumps(value, indent)
+
+    @staticmethod
+    def _stdlib_dumps(value: Any, indent: Optional[int]) -> str:
+        separators = (",", ":") if indent is None else None
+        return json.dumps(value, indent=indent, separators=separators, ensure_ascii=False, default=_default)
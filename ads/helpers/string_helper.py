@@ -1,15 +1,106 @@
+import functools
+import hashlib
+import os
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 import jinja2
 
+from ads.helpers.filesystem_helper import FileSystemHelper
+
+# Directory of the on-disk Jinja bytecode cache (compiled templates survive process restarts), empty disables it
+BYTECODE_CACHE_DIR_ENV = "ADS_JINJA_CACHE_DIR"
+# Default directory, relative to the user's home (resolved on first use, not at import)
+DEFAULT_BYTECODE_CACHE_SUBDIR = Path(".cache") / "argos" / "jinja"
+
+
+@functools.lru_cache(maxsize=None)
+def _build_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    """Returns the filesystem bytecode cache, or None when disabled, without a home directory or not writable."""
+    try:
+        cache_dir = os.getenv(BYTECODE_CACHE_DIR_ENV)
+        if cache_dir is None:
+            cache_dir = str(Path.home() / DEFAULT_BYTECODE_CACHE_SUBDIR)
+        if not cache_dir:
+            return None
+        path = FileSystemHelper().create_parent_directories(path=Path(cache_dir).expanduser())
+    except (OSError, RuntimeError):  # RuntimeError: no resolvable home directory
+        return None
+    return jinja2.FileSystemBytecodeCache(directory=str(path))
+
+
+class _LazyBytecodeCache(jinja2.BytecodeCache):
+    """
+    Bytecode cache resolving its directory on the first compiled template instead of at import,
+    so importing ADS never touches the filesystem (read-only homes, no HOME) and such failures only disable caching.
+    """
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        cache = _build_bytecode_cache()
+        if cache is not None:
+            cache.load_bytecode(bucket)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        cache = _build_bytecode_cache()
+        if cache is not None:
+            cache.dump_bytecode(bucket)
+
+    def clear(self) -> None:
+        cache = _build_bytecode_cache()
+        if cache is not None:
+            cache.clear()
+
+
+BYTECODE_CACHE = _LazyBytecodeCache()
+
+
+def compile_template_source(env: jinja2.Environment, source: str, namespace: str) -> jinja2.Template:
+    """
+    Compiles a template source string, going through the environment's bytecode cache (if any).
+
+    `Environment.from_string` never consults the bytecode cache (only loaders do), so this mirrors
+    `BaseLoader.load` for in-memory sources. `namespace` must identify the environment configuration,
+    since the same source compiles differently under e.g. other whitespace settings.
+    """
+    bcc = env.bytecode_cache
+    if bcc is None:
+        return env.from_string(source)
+
+    name = f"{namespace}:{hashlib.sha256(source.encode('utf-8')).hexdigest()}"
+    bucket = bcc.get_bucket(env, name, None, source)
+    code = bucket.code
+    if code is None:
+        code = env.compile(source, name)
+        bucket.code = code
+        try:
+            bcc.set_bucket(bucket)
+        except OSError:
+            # Best effort only, a read-only or full disk just means compiling again next time
+            pass
+    return env.template_class.from_code(env, code, env.make_globals(None), None)
+
+
+# Environments are expensive to build (lexer, parser, filters), one shared instance per undefined-handling mode
+_ENV_STRICT = jinja2.Environment(undefined=jinja2.StrictUndefined, bytecode_cache=BYTECODE_CACHE)
+_ENV_DEBUG = jinja2.Environment(undefined=jinja2.DebugUndefined, bytecode_cache=BYTECODE_CACHE)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(value: str, keep_undefined_as_is: bool) -> jinja2.Template:
+    """Parses and compiles a template source once per (source, undefined mode) pair."""
+    env = _ENV_DEBUG if keep_undefined_as_is else _ENV_STRICT
+    return compile_template_source(env=env, source=value, namespace="string_helper")
+
 
 class StringHelper:
     """String utilities, including Jinja2 rendering."""
 
+    __slots__ = ()
+
     @staticmethod
     def render_jinja_template(value: str,
                               params: Optional[Dict[str, Any]],
-                              keep_undefined_as_is: Optional[bool] = False) -> str:
+                              keep_undefined_as_is: bool = False) -> str:
         """
         Renders a Jinja-templated string using provided parameters.
 
@@ -18,6 +109,5 @@ class StringHelper:
             params = {"table": "my_table"}
         """
 
-        env = jinja2.Environment(undefined=jinja2.DebugUndefined if keep_undefined_as_is else jinja2.StrictUndefined)
-        template = env.from_string(value)
+        template = _compile_template(value, bool(keep_undefined_as_is))
         return template.render(params or {})
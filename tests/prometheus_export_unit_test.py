@@ -25,3 +25,47 @@ def test_prometheus_file_export(tmp_path):
     assert "null_check" in content
     assert "unique_check" in content
     assert "FAIL" in content
+
+
+def test_prometheus_user_labels_override_defaults(tmp_path):
+    exporter = PrometheusExporter()
+    output_path = tmp_path / "metrics.prom"
+
+    metadata = ResultsMetadata(suite_name="sales_suite", status=SuiteRunStatus.SUCCESS)
+    results = [
+        Result(check_name="null_check", status=CheckStatus.PASS, severity=Severity.INFO, value=0),
+        Result(check_name="unique_check", status=CheckStatus.FAIL, severity=Severity.CRITICAL, value=5),
+    ]
+
+    exporter.export(metadata=metadata, results=results, destination=output_path,
+                    config={"labels": {"suite": "override", "env": "test"}})
+
+    lines = output_path.read_text().splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith('ads_check_value{suite="override",check="unique_check",status="FAIL",severity="CRITICAL",env="test"} 5.0 ')
+
+
+def test_prometheus_label_values_are_escaped(tmp_path):
+    exporter = PrometheusExporter()
+    output_path = tmp_path / "metrics.prom"
+
+    metadata = ResultsMetadata(suite_name='sales "eu"', status=SuiteRunStatus.SUCCESS)
+    results = [Result(check_name="path\\check\nv2", status=CheckStatus.PASS, severity=Severity.INFO, value=1)]
+
+    exporter.export(metadata=metadata, results=results, destination=output_path)
+
+    lines = output_path.read_text().splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith('ads_check_value{suite="sales \\"eu\\"",check="path\\\\check\\nv2",status="PASS",severity="INFO"} 1.0 ')
+
+
+def test_prometheus_file_is_utf8(tmp_path):
+    exporter = PrometheusExporter()
+    output_path = tmp_path / "metrics.prom"
+
+    metadata = ResultsMetadata(suite_name="satış", status=SuiteRunStatus.SUCCESS)
+    results = [Result(check_name="müşteri_check", status=CheckStatus.PASS, severity=Severity.INFO, value=1)]
+
+    exporter.export(metadata=metadata, results=results, destination=output_path)
+
+    assert output_path.read_bytes().startswith('ads_check_value{suite="satış",check="müşteri_check"'.encode("utf-8"))
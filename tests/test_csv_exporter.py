@@ -0,0 +1,69 @@
+import csv
+import json
+
+from ads.core.enums import CheckStatus, Severity, SuiteRunStatus
+from ads.core.exporters.csv_exporter import CsvExporter
+from ads.core.models import Result, ResultsMetadata
+
+
+def test_csv_export(tmp_path):
+    exporter = CsvExporter()
+    metadata = ResultsMetadata(
+        job_id="job_001",
+        suite_name="sales suite",
+        status=SuiteRunStatus.SUCCESS,
+        errors=["first error"]
+    )
+    results = [
+        Result(check_name="null_check", status=CheckStatus.PASS, severity=Severity.INFO, value=0.0, message="No nulls, found"),
+        Result(check_name="unique_check", status=CheckStatus.FAIL, severity=Severity.CRITICAL, value=12, threshold_upper=0,
+               check_params={"column_name": "order_id"}),
+    ]
+
+    exporter.export(metadata=metadata, results=results, destination=str(tmp_path), config={"column_delimiter": ";"})
+
+    with (tmp_path / "sales_suite_run.csv").open(encoding="utf-8", newline="") as f:
+        run_rows = list(csv.DictReader(f, delimiter=";"))
+    assert len(run_rows) == 1
+    assert run_rows[0]["job_id"] == "job_001"
+    assert run_rows[0]["status"] == "SUCCESS"
+    assert run_rows[0]["error_count"] == "1"
+
+    with (tmp_path / "sales_suite_results.csv").open(encoding="utf-8", newline="") as f:
+        result_rows = list(csv.DictReader(f, delimiter=";"))
+    assert [r["check_name"] for r in result_rows] == ["null_check", "unique_check"]
+    assert result_rows[0]["message"] == "No nulls, found"
+    assert result_rows[1]["status"] == "FAIL"
+    assert result_rows[1]["severity"] == "CRITICAL"
+    assert result_rows[1]["value"] == "12.0"
+    assert result_rows[1]["threshold_upper"] == "0.0"
+    assert result_rows[0]["check_params"] == ""
+    assert json.loads(result_rows[1]["check_params"]) == {"column_name": "order_id"}
+
+
+def test_csv_export_without_results(tmp_path):
+    CsvExporter().export(metadata=ResultsMetadata(suite_name="empty_suite"), results=[], destination=str(tmp_path))
+
+    lines = (tmp_path / "empty_suite_results.csv").read_text(encoding="utf-8").splitlines()
+    assert lines == ["check_name,check_description,check_params,status,severity,value,threshold_lower,threshold_upper,message"]
+
+
+def test_sanitize_name():
+    exporter = CsvExporter()
+    assert exporter._sanitize_name("sales suite/v1.2-final") == "sales_suite_v1.2-final"
+    assert exporter._sanitize_name("müşteri — suite") == "müşteri___suite"
+
+
+def test_csv_export_in_multiple_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(CsvExporter, "WRITE_CHUNK_ROWS", 2)
+    metadata = ResultsMetadata(job_id="job_001", suite_name="chunked", status=SuiteRunStatus.SUCCESS)
+    results = [
+        Result(check_name=f"check_ü_{i}", status=CheckStatus.PASS, severity=Severity.INFO, value=float(i))
+        for i in range(5)
+    ]
+
+    CsvExporter().export(metadata=metadata, results=results, destination=str(tmp_path))
+
+    with (tmp_path / "chunked_results.csv").open(encoding="utf-8", newline="") as f:
+        result_rows = list(csv.DictReader(f))
+    assert [row["check_name"] for row in result_rows] == [f"check_ü_{i}" for i in range(5)]
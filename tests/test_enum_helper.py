@@ -0,0 +1,10 @@
+from ads.core.enums import CheckStatus
+from ads.helpers.enum_helper import EnumHelper
+
+
+def test_get_value():
+    helper = EnumHelper()
+    assert helper.get_value(CheckStatus.PASS) == CheckStatus.PASS.value
+    assert helper.get_value("raw") == "raw"
+    assert helper.get_value(None, default_value="unknown") == "unknown"
+    assert helper.get_value(None) == "None"
@@ -0,0 +1,255 @@
+from types import SimpleNamespace
+
+from google.cloud.bigquery.table import Row
+
+from ads.core.engine.executor import Executor
+from ads.core.enums import SuiteRunStatus
+from ads.core.models import DataSource, DataSourceType, Suite
+from ads.helpers.helper_library import HelperLibrary
+
+
+def test_flatten_rows():
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+
+    flat_row = executor._flatten_rows(data={
+        "a": {"b": {"c": 1}},
+        "d": [10, 20],
+        "e": [{"f": {"g": 1}}, 5],
+        "h": "leaf"
+    })
+
+    assert flat_row == {
+        "a.b.c": 1,
+        "d[0]": 10,
+        "d[1]": 20,
+        "e[0].f.g": 1,
+        "e[1]": 5,
+        "h": "leaf"
+    }
+    assert list(flat_row.keys()) == ["a.b.c", "d[0]", "d[1]", "e[0].f.g", "e[1]", "h"]
+
+
+def test_flatten_rows_deep_nesting():
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+
+    data = value = {}
+    for _ in range(5000):
+        value["x"] = {}
+        value = value["x"]
+    value["y"] = 1
+
+    flat_row = executor._flatten_rows(data=data)
+    assert list(flat_row.values()) == [1]
+
+
+class _FailingClient:
+    def query(self, *_, **__):
+        raise RuntimeError("Syntax error: Unexpected keyword")
+
+
+def test_execute_failure_collects_errors():
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+    executor._client = _FailingClient()
+    suite = Suite(name="orders_suite", data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"))
+
+    metadata, rows = executor.execute(suite=suite, sql_query="SELEC 1")
+
+    assert list(rows) == []
+    assert metadata.status == SuiteRunStatus.FAILED
+    assert metadata.errors == ["Syntax error: Unexpected keyword"]
+    assert metadata.ended_at >= metadata.started_at
+    assert metadata.duration_ms >= 0
+
+
+def test_execute_many_keeps_order():
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+    executor._client = _FailingClient()
+    suites = [
+        Suite(name=f"suite_{idx}", data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"))
+        for idx in range(5)
+    ]
+
+    outcomes = executor.execute_many(queries=[(suite, "SELEC 1") for suite in suites], max_concurrency=2)
+
+    assert [metadata.suite_name for metadata, _ in outcomes] == [suite.name for suite in suites]
+    assert all(metadata.status == SuiteRunStatus.FAILED for metadata, _ in outcomes)
+
+
+class _FakeRowIterator:
+    total_rows = 2
+
+    @property
+    def pages(self):
+        yield [Row(({"b": 1}, 10), {"a": 0, "c": 1})]
+        yield [Row(({"b": 2}, 20), {"a": 0, "c": 1})]
+
+
+def test_iter_dict_rows():
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+
+    rows = executor._iter_dict_rows(result=_FakeRowIterator())
+    assert next(rows) == {"a": {"b": 1}, "c": 10}
+    assert list(rows) == [{"a": {"b": 2}, "c": 20}]
+    assert list(executor._iter_dict_rows(result=_FakeRowIterator(), flatten=True)) == [{"a.b": 1, "c": 10}, {"a.b": 2, "c": 20}]
+
+
+class _DryRunClient:
+    def __init__(self):
+        self.calls = 0
+
+    def query(self, *_, **__):
+        self.calls += 1
+        return SimpleNamespace(job_id=f"dry_run_{self.calls}", total_bytes_processed=1024, cache_hit=False)
+
+
+def test_validate_only_reuses_cached_dry_run():
+    executor = Executor(project_id="dry_run_project", helpers=HelperLibrary())
+    executor._client = _DryRunClient()
+    suite = Suite(name="orders_suite", data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"))
+
+    first_metadata, first_rows = executor.execute(suite=suite, sql_query="SELECT 1", validate_only=True)
+    assert next(first_rows, None) is None
+    second_metadata, _ = executor.execute(suite=suite, sql_query="SELECT 1", validate_only=True)
+    executor.execute(suite=suite, sql_query="SELECT 2", validate_only=True)
+
+    assert executor._client.calls == 2
+    assert first_metadata.status == second_metadata.status == SuiteRunStatus.VALIDATION_SUCCESS
+    assert first_metadata.job_id == "dry_run_1"
+    assert not (first_metadata.extra or {}).get("dry_run_cached")
+    # A cache hit reports the reused statistics, but not the earlier run's job as its own
+    assert second_metadata.job_id is None
+    assert second_metadata.extra == {"dry_run_cached": True}
+    assert second_metadata.bytes_processed == 1024
+
+
+def test_executor_logger_and_helpers():
+    helpers = HelperLibrary()
+    executor = Executor(project_id="dummy", helpers=helpers)
+
+    assert executor.logger.name == "ads.core.engine.executor"
+    assert executor.helpers is helpers
+
+
+class _FakeRecordBatch:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def to_pylist(self):
+        return self._rows
+
+
+class _FakeArrowRowIterator:
+    total_rows = 5000
+
+    def __init__(self):
+        self.bqstorage_client = None
+
+    def to_arrow_iterable(self, bqstorage_client=None):
+        self.bqstorage_client = bqstorage_client
+        yield _FakeRecordBatch([{"a": {"b": 1}}])
+        yield _FakeRecordBatch([{"a": {"b": 2}}])
+
+
+def test_iter_dict_rows_streams_arrow_batches(monkeypatch):
+    from ads.core.engine import executor as executor_module
+
+    monkeypatch.setattr(executor_module, "PYARROW_AVAILABLE", True)
+    monkeypatch.setattr(executor_module, "get_bqstorage_client", lambda: "bqstorage")
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+    result = _FakeArrowRowIterator()
+
+    assert list(executor._iter_dict_rows(result=result, flatten=True)) == [{"a.b": 1}, {"a.b": 2}]
+    assert result.bqstorage_client == "bqstorage"
+
+
+class _TimingOutJob:
+    job_id = "slow_job"
+    errors = None
+
+    def __init__(self):
+        self.cancelled = False
+
+    def result(self, timeout=None):
+        import concurrent.futures
+        raise concurrent.futures.TimeoutError()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def test_execute_cancels_timed_out_job():
+    job = _TimingOutJob()
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+    executor._client = SimpleNamespace(query=lambda **kwargs: job)
+    suite = Suite(name="orders_suite", data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"))
+
+    metadata, rows = executor.execute(suite=suite, sql_query="SELECT 1")
+
+    assert job.cancelled
+    assert metadata.status == SuiteRunStatus.FAILED
+    assert metadata.job_id == "slow_job"
+
+
+class _FailingPagesRowIterator:
+    total_rows = 2
+
+    @property
+    def pages(self):
+        yield [Row((1,), {"value": 0})]
+        raise RuntimeError("403 Access Denied: quota exceeded")
+
+
+class _FinishedJob:
+    job_id = "paged_job"
+    total_bytes_processed = 10
+    cache_hit = False
+    errors = None
+
+    def result(self, timeout=None):
+        return _FailingPagesRowIterator()
+
+
+def test_execute_marks_failed_page_fetch():
+    executor = Executor(project_id="dummy", helpers=HelperLibrary())
+    executor._client = SimpleNamespace(query=lambda **kwargs: _FinishedJob())
+    suite = Suite(name="orders_suite", data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"))
+
+    metadata, rows = executor.execute(suite=suite, sql_query="SELECT 1")
+    assert metadata.status == SuiteRunStatus.SUCCESS
+
+    assert list(rows) == [{"value": 1}]
+    assert metadata.status == SuiteRunStatus.FAILED
+    assert metadata.errors == ["403 Access Denied: quota exceeded"]
+    assert metadata.ended_at >= metadata.started_at
+
+
+def test_get_bigquery_client_passes_pooled_session(monkeypatch):
+    from google.auth.credentials import AnonymousCredentials
+    from ads.core.engine import executor as executor_module
+
+    monkeypatch.setattr(executor_module, "_get_default_credentials", lambda: AnonymousCredentials())
+    executor_module.get_bigquery_client.cache_clear()
+    try:
+        client = executor_module.get_bigquery_client(project_id="pooled_project")
+        adapter = client._http.get_adapter("https://bigquery.googleapis.com")
+        assert adapter._pool_maxsize == executor_module.HTTP_POOL_SIZE
+        assert client is executor_module.get_bigquery_client(project_id="pooled_project")
+    finally:
+        executor_module.get_bigquery_client.cache_clear()
+
+
+def test_default_job_config_builds_a_valid_jobs_query_request():
+    from google.cloud.bigquery import _job_helpers
+    from ads.core.engine.executor import _DEFAULT_JOB_CONFIG
+
+    # Fields of the jobs.query QueryRequest body, anything else is rejected by BigQuery with a 400
+    query_request_fields = {
+        "kind", "query", "maxResults", "defaultDataset", "timeoutMs", "jobTimeoutMs", "destinationEncryptionConfiguration",
+        "dryRun", "preserveNulls", "useQueryCache", "useLegacySql", "parameterMode", "queryParameters", "location",
+        "formatOptions", "connectionProperties", "labels", "maximumBytesBilled", "requestId", "createSession",
+        "jobCreationMode", "continuous", "writeIncrementalResults", "reservation",
+    }
+
+    request_body = _job_helpers._to_query_request(_DEFAULT_JOB_CONFIG, query="SELECT 1")
+
+    assert set(request_body) <= query_request_fields
@@ -0,0 +1,68 @@
+from ads.core.enums import ResultExportType
+from ads.core.exporters.exporter_registry import ExporterRegistry
+from ads.core.exporters.html_exporter import HtmlExporter
+
+
+def test_exporters_are_created_once_on_demand():
+    registry = ExporterRegistry()
+    assert registry._exporters == {}
+
+    exporter = registry.get(export_type=ResultExportType.CSV)
+    assert registry.get(export_type=ResultExportType.CSV) is exporter
+    assert list(registry._exporters) == [ResultExportType.CSV]
+
+
+def test_every_export_type_has_an_exporter():
+    registry = ExporterRegistry()
+    assert isinstance(registry.get(export_type=ResultExportType.HTML), HtmlExporter)
+    assert set(ResultExportType) == set(registry.EXPORTER_PATHS)
+
+
+def test_run_all(tmp_path):
+    from ads.core.enums import SuiteRunStatus
+    from ads.core.models import ResultsMetadata
+
+    metadata = ResultsMetadata(job_id="job_001", suite_name="sales_suite", status=SuiteRunStatus.SUCCESS)
+    exported = ExporterRegistry().run_all(
+        export_types=[ResultExportType.JSON, ResultExportType.CSV, ResultExportType.PROMETHEUS],
+        metadata=metadata,
+        results=[],
+        destinations={
+            ResultExportType.JSON: str(tmp_path / "results.json"),
+            ResultExportType.CSV: str(tmp_path / "csv"),
+            ResultExportType.PROMETHEUS: str(tmp_path / "metrics.prom"),
+        }
+    )
+
+    assert list(exported) == [ResultExportType.JSON, ResultExportType.CSV, ResultExportType.PROMETHEUS]
+    assert (tmp_path / "results.json").exists()
+    assert (tmp_path / "csv" / "sales_suite_run.csv").exists()
+    assert (tmp_path / "metrics.prom").exists()
+
+
+def test_run_all_serializes_metadata_once(tmp_path, monkeypatch):
+    from ads.core.enums import SuiteRunStatus
+    from ads.core.models import ResultsMetadata
+
+    metadata = ResultsMetadata(job_id="job_001", suite_name="sales_suite", status=SuiteRunStatus.SUCCESS)
+    dumps = []
+    original_model_dump = ResultsMetadata.model_dump
+
+    def _counting_model_dump(self, *args, **kwargs):
+        dumps.append(kwargs.get("mode"))
+        return original_model_dump(self, *args, **kwargs)
+
+    monkeypatch.setattr(ResultsMetadata, "model_dump", _counting_model_dump)
+
+    ExporterRegistry().run_all(
+        export_types=[ResultExportType.JSON, ResultExportType.CSV, ResultExportType.HTML],
+        metadata=metadata,
+        results=[],
+        destinations={
+            ResultExportType.JSON: str(tmp_path / "results.json"),
+            ResultExportType.CSV: str(tmp_path / "csv"),
+            ResultExportType.HTML: str(tmp_path / "report.html"),
+        }
+    )
+
+    assert dumps == ["json"]
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import pytest
+
+from ads.helpers.filesystem_helper import FileSystemHelper
+
+
+def test_create_parent_directories(tmp_path, monkeypatch):
+    helper = FileSystemHelper()
+    nested = tmp_path / "a" / "b"
+
+    assert helper.create_parent_directories(path=nested) == nested
+    assert nested.is_dir()
+
+    # Existing directories are not created again
+    monkeypatch.setattr(Path, "mkdir", lambda *args, **kwargs: pytest.fail("mkdir called for an existing directory"))
+    assert helper.create_parent_directories(path=nested) == nested
@@ -1,4 +1,4 @@
-from ads.core.exporters.html_exporter import HtmlExporter
+from ads.core.exporters.html_exporter import HtmlExporter, _load_html_template
 from ads.core.models import ResultsMetadata, Result
 from ads.core.enums import SuiteRunStatus, CheckStatus, Severity
 
@@ -25,3 +25,40 @@ def test_html_exporter(tmp_path):
     assert "Suite Run Metadata" in content
     assert "Suite Results" in content
     assert "This is a test HTML export" in content
+
+
+def test_html_template_is_compiled_once(tmp_path):
+    exporter = HtmlExporter()
+    metadata = ResultsMetadata(job_id="job_002", suite_name="cache_suite", status=SuiteRunStatus.SUCCESS)
+
+    exporter.export(metadata=metadata, results=[], destination=tmp_path / "first.html")
+    hits = _load_html_template.cache_info().hits
+    exporter.export(metadata=metadata, results=[], destination=tmp_path / "second.html")
+
+    assert _load_html_template.cache_info().hits == hits + 1
+    assert (tmp_path / "second.html").read_text(encoding="utf-8").count("cache_suite") >= 1
+
+
+def test_https_logo_is_fetched_as_url(monkeypatch):
+    from ads.core.exporters import html_exporter
+
+    requested = []
+
+    class _Response:
+        content = b"logo"
+
+        def raise_for_status(self):
+            pass
+
+    def _get(url):
+        requested.append(url)
+        return _Response()
+
+    monkeypatch.setattr(html_exporter._SESSION, "get", _get)
+    html_exporter._load_logo_base64.cache_clear()
+
+    logo_url = "HTTPS://example.com/logo.png"
+    assert HtmlExporter()._get_logo_base64(logo_path=logo_url) == "bG9nbw=="
+    assert HtmlExporter()._get_logo_base64(logo_path=logo_url) == "bG9nbw=="
+    assert requested == [logo_url]
+    html_exporter._load_logo_base64.cache_clear()
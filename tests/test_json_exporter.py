@@ -12,9 +12,9 @@ class MockExecutor:
     def __init__(self, *_, **__):
         self._called = False
 
-    def execute(self, *_, **__):
+    def execute(self, suite, *_, **__):
         self._called = True
-        metadata = ResultsMetadata(status="SUCCESS", duration_ms=1234.5, job_id="bq_mock_job_1")
+        metadata = ResultsMetadata(suite_name=suite.name, status="SUCCESS", duration_ms=1234.5, job_id="bq_mock_job_1")
         rows = [
             {"check_name": "customer_id_null_check", "value": 0.0},
             {"check_name": "positive_revenue_check", "value": 1.2},
@@ -92,3 +92,40 @@ def test_end_to_end_json_export(monkeypatch, tmp_path):
     assert exported_results[0]["check_name"] == "customer_id_null_check"
     assert exported_results[1]["check_name"] == "positive_revenue_check"
     # endregion
+
+
+def test_json_export_streams_valid_document(tmp_path):
+    from ads.core.exporters.json_exporter import JsonExporter
+    from ads.core.models import Result
+
+    metadata = ResultsMetadata(job_id="job_001", suite_name="sales_suite", status=SuiteRunStatus.SUCCESS)
+    results = [
+        Result(check_name="null_check", status=CheckStatus.PASS, severity=Severity.INFO, value=0.0),
+        Result(check_name="unique_check", status=CheckStatus.FAIL, severity=Severity.CRITICAL, value=12, message="Dupes: ü"),
+    ]
+
+    output_path = tmp_path / "results.json"
+    JsonExporter().export(metadata=metadata, results=results, destination=str(output_path))
+    content = json.loads(output_path.read_text(encoding="utf-8"))
+    assert content["metadata"]["job_id"] == "job_001"
+    assert [r["check_name"] for r in content["results"]] == ["null_check", "unique_check"]
+    assert content["results"][1]["message"] == "Dupes: ü"
+
+    empty_path = tmp_path / "empty.json"
+    JsonExporter().export(metadata=metadata, results=[], destination=str(empty_path), config={"indent": 2})
+    assert json.loads(empty_path.read_text(encoding="utf-8"))["results"] == []
+
+
+def test_json_export_fsync_is_opt_in(monkeypatch, tmp_path):
+    from ads.core.exporters import exporter_base
+    from ads.core.exporters.json_exporter import JsonExporter
+
+    synced = []
+    monkeypatch.setattr(exporter_base.os, "fsync", synced.append)
+
+    metadata = ResultsMetadata(job_id="job_001", suite_name="sales_suite", status=SuiteRunStatus.SUCCESS)
+    JsonExporter().export(metadata=metadata, results=[], destination=str(tmp_path / "default.json"))
+    assert synced == []
+
+    JsonExporter().export(metadata=metadata, results=[], destination=str(tmp_path / "durable.json"), config={"fsync": True})
+    assert len(synced) == 1
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from ads.helpers import json_helper
+from ads.helpers.json_helper import JsonHelper
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_round_trip(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_helper, "orjson", None)
+    elif json_helper.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    value = {"name": "ü", "values": [1, 2.5, None], "nested": {"ok": True}}
+    helper = JsonHelper()
+
+    assert helper.dumps(value) == '{"name":"ü","values":[1,2.5,null],"nested":{"ok":true}}'
+    assert helper.dumps_bytes(value) == helper.dumps(value).encode("utf-8")
+    assert json.loads(helper.dumps(value, indent=4)) == value
+    assert json.loads(helper.dumps_bytes(value, indent=2)) == value
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_enums_dataclasses_and_datetimes(monkeypatch, use_orjson):
+    import datetime
+
+    from ads.core.enums import CheckStatus
+    from ads.core.models import ResultRow
+
+    if not use_orjson:
+        monkeypatch.setattr(json_helper, "orjson", None)
+    elif json_helper.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    value = {
+        "status": CheckStatus.PASS,
+        "row": ResultRow(check_name="c", status=CheckStatus.FAIL, value=1.5),
+        "at": datetime.datetime(2025, 1, 2, 3, 4, 5),
+    }
+    decoded = json.loads(JsonHelper().dumps(value))
+
+    assert decoded["status"] == CheckStatus.PASS.value
+    assert decoded["row"]["check_name"] == "c" and decoded["row"]["status"] == CheckStatus.FAIL.value
+    assert decoded["at"] == "2025-01-02T03:04:05+00:00"
@@ -0,0 +1,74 @@
+from ads.core.enums import SuiteRunStatus
+from ads.core.models import ResultsMetadata
+
+
+def test_results_metadata_json_dict_cache():
+    metadata = ResultsMetadata(suite_name="sales_suite")
+
+    json_dict = metadata.json_dict
+    assert json_dict["status"] == "UNKNOWN"
+    assert metadata.json_dict is json_dict
+
+    metadata.status = SuiteRunStatus.SUCCESS
+    assert metadata.json_dict is not json_dict
+    assert metadata.json_dict["status"] == "SUCCESS"
+
+    warmed = ResultsMetadata(suite_name="sales_suite")
+    warmed.warm_json_cache()
+    assert warmed._json_dict_cache is not None and warmed.json_dict is warmed._json_dict_cache
+
+
+def test_result_and_threshold_are_frozen():
+    import pytest
+    from pydantic import ValidationError
+
+    from ads.core.enums import CheckStatus, Severity
+    from ads.core.models import Result, Threshold
+
+    threshold = Threshold(value=3)
+    assert (threshold.lower, threshold.upper) == (3.0, 3.0)
+    with pytest.raises(ValidationError):
+        threshold.lower = 1
+
+    result = Result.from_trusted(check_name="null_check", status=CheckStatus.PASS, severity=Severity.INFO, value=0.0)
+    assert result.json_dict["status"] == "PASS"
+    assert result.json_dict["check_description"] is None
+    with pytest.raises(ValidationError):
+        result.value = 1.0
+
+
+def test_threshold_is_within():
+    from ads.core.models import Threshold
+
+    assert Threshold().is_within(-1e300)
+    assert Threshold(value=0).is_within(0) and not Threshold(value=0).is_within(0.1)
+    assert Threshold(lower=1).is_within(5) and not Threshold(lower=1).is_within(0)
+    assert Threshold(upper=1).is_within(-5) and not Threshold(upper=1).is_within(2)
+    assert Threshold(lower=1, upper=3).is_within(3) and not Threshold(lower=1, upper=3).is_within(3.5)
+    assert Threshold.model_construct(lower=2.0, upper=None).is_within(2.5)
+
+
+def test_results_metadata_rejects_unknown_fields():
+    import pytest
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        ResultsMetadata(suite_name="sales_suite", unknown_field=1)
+
+
+def test_helpers_have_no_instance_dict():
+    from ads.helpers.helper_library import HelperLibrary
+
+    helpers = HelperLibrary()
+    for helper in (helpers, helpers.string, helpers.enum, helpers.filesystem, helpers.json):
+        assert not hasattr(helper, "__dict__")
+
+
+def test_from_trusted_interns_names():
+    import sys
+
+    from ads.core.models import Check, Result
+
+    name = "".join(["orders", "_null_check"])
+    assert Check(name=name).name is sys.intern("orders_null_check")
+    assert Result.from_trusted(check_name=name).check_name is sys.intern("orders_null_check")
@@ -0,0 +1,35 @@
+import pytest
+
+from ads.core.enums import CheckStatus, ResultExportType, Severity, SuiteRunStatus
+from ads.core.exporters import msgpack_exporter
+from ads.core.exporters.exporter_registry import ExporterRegistry
+from ads.core.exporters.msgpack_exporter import MsgpackExporter
+from ads.core.models import Result, ResultsMetadata
+
+
+def _export(tmp_path):
+    metadata = ResultsMetadata(job_id="job_001", suite_name="sales_suite", status=SuiteRunStatus.SUCCESS)
+    results = [Result(check_name="null_check", status=CheckStatus.PASS, severity=Severity.INFO, value=0)]
+    return MsgpackExporter().export(metadata=metadata, results=results, destination=str(tmp_path / "out.msgpack"))
+
+
+def test_msgpack_export(tmp_path):
+    msgpack = pytest.importorskip("msgpack")
+
+    with open(_export(tmp_path), "rb") as f:
+        payload = msgpack.unpackb(f.read(), raw=False)
+
+    assert payload["metadata"]["suite_name"] == "sales_suite"
+    assert payload["results"][0]["check_name"] == "null_check"
+    assert payload["results"][0]["status"] == CheckStatus.PASS.value
+
+
+def test_msgpack_export_requires_msgpack(tmp_path, monkeypatch):
+    monkeypatch.setattr(msgpack_exporter, "msgpack", None)
+
+    with pytest.raises(ImportError, match="msgpack"):
+        _export(tmp_path)
+
+
+def test_msgpack_exporter_is_registered():
+    assert isinstance(ExporterRegistry().get(export_type=ResultExportType.MSGPACK), MsgpackExporter)
@@ -0,0 +1,12 @@
+import unicodedata
+from pathlib import Path
+
+import ads
+
+
+def test_module_paths_are_ascii():
+    # Look-alike characters (e.g. a dotless "ı") in a module name break `import` of the intended name
+    package_root = Path(ads.__file__).parent
+    non_ascii = [str(path.relative_to(package_root)) for path in package_root.rglob("*")
+                 if "__pycache__" not in path.parts and not unicodedata.normalize("NFKD", path.name).isascii()]
+    assert non_ascii == []
@@ -0,0 +1,101 @@
+import sys
+
+from ads.core.engine.result_parser import ResultParser
+from ads.core.enums import CheckStatus, Severity
+from ads.core.models import Check, DataSource, DataSourceType, Suite, Threshold
+
+
+def _build_suite() -> Suite:
+    return Suite(
+        name="orders_suite",
+        data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"),
+        checks=[
+            Check(name="row_count_check", threshold=Threshold(lower=100), severity=Severity.CRITICAL),
+            Check(name="null_check", threshold=Threshold(value=0)),
+        ]
+    )
+
+
+def test_parse_rows():
+    rows = [
+        {"check_name": "row_count_check", "value": 150},
+        {"check_name": "null_check", "value": 3},
+        {"check_name": "unknown_check", "value": 1},
+        {"check_name": "null_check", "other": 1},
+    ]
+
+    results = ResultParser().parse(suite=_build_suite(), rows=rows)
+
+    assert [r.check_name for r in results] == ["row_count_check", "null_check", "null_check"]
+    assert results[0].status == CheckStatus.PASS
+    assert results[0].severity == Severity.CRITICAL
+    assert results[0].value == 150.0
+    assert results[1].status == CheckStatus.FAIL
+    assert results[1].threshold_lower == 0 and results[1].threshold_upper == 0
+    assert results[2].status == CheckStatus.ERROR
+    assert results[2].value is None
+
+
+def test_parse_rows_with_null_value():
+    rows = [{"check_name": "null_check", "ratio": None}, {"check_name": "row_count_check", "ratio": 120}]
+
+    results = ResultParser().parse(suite=_build_suite(), rows=rows)
+
+    assert results[0].status == CheckStatus.ERROR
+    assert results[1].status == CheckStatus.PASS
+    assert results[1].value == 120.0
+
+
+def test_parse_rows_returns_slotted_rows_convertible_to_results():
+    from ads.core.models import Result, ResultRow
+
+    rows = ResultParser().parse_rows(suite=_build_suite(), rows=[{"check_name": "null_check", "value": 0}])
+
+    assert isinstance(rows[0], ResultRow)
+    assert not hasattr(rows[0], "__dict__")
+    result = rows[0].to_result()
+    assert isinstance(result, Result)
+    assert result.status == CheckStatus.PASS
+    assert result.json_dict["check_name"] == "null_check"
+
+
+def test_parsed_check_names_are_shared_with_the_suite():
+    suite = _build_suite()
+    row_name = "".join(["null", "_check"])
+
+    rows = ResultParser().parse_rows(suite=suite, rows=[{"check_name": row_name, "value": 0}])
+
+    assert rows[0].check_name is suite.checks[1].name
+    assert suite.checks[1].name is sys.intern("null_check")
+
+
+class _FakeArrowColumn:
+    def __init__(self, values):
+        self._values = values
+
+    def to_pylist(self):
+        return self._values
+
+
+class _FakeArrowTable:
+    """Minimal stand-in for a pyarrow Table (column_names / column(name).to_pylist())."""
+
+    def __init__(self, columns):
+        self._columns = columns
+        self.column_names = list(columns)
+
+    def column(self, name):
+        return _FakeArrowColumn(self._columns[name])
+
+
+def test_parse_arrow_table_columns():
+    table = _FakeArrowTable({"check_name": ["row_count_check", "null_check", "unknown_check"],
+                             "ratio": [150, None, 1],
+                             "ignored": ["a", "b", "c"]})
+
+    results = ResultParser().parse(suite=_build_suite(), rows=table)
+
+    assert [(r.check_name, r.status, r.value) for r in results] == [
+        ("row_count_check", CheckStatus.PASS, 150.0),
+        ("null_check", CheckStatus.ERROR, None),
+    ]
@@ -1,3 +1,5 @@
+import pytest
+
 from ads.core.rules.ruleset_registry import RulesetRegistry
 
 
@@ -12,3 +14,171 @@ def test_plugin_rule_loading():
     registry = RulesetRegistry()
     greater_than_rule = registry.plugins.get("greater_than")
     print(f"Rule '{greater_than_rule.name}' loaded with the required parameters {', '.join(greater_than_rule.required_params)}")
+
+
+def test_rule_templates_are_compiled_at_class_creation():
+    from ads.core.rules.builtin.not_null_rule import NotNullRule
+
+    assert NotNullRule._compiled_template is not None
+    sql = NotNullRule().render(helpers=None, extra_params={"check_name": "c", "suite_name": "s", "column_name": "id"})
+    assert "COUNTIF(id IS NULL)" in sql
+
+
+def test_unresolved_template_variable_raises():
+    import pytest
+
+    from ads.core.rules.exceptions import RuleParameterError
+    from ads.plugins.rules.greater_than_rule import GreaterThan
+
+    rule = GreaterThan(params={"lower_limit_value": 5})
+    with pytest.raises(RuleParameterError, match="suite_name"):
+        rule.render(helpers=None, extra_params={"check_name": "c", "column_name": "amount"})
+
+
+def test_missing_required_params_raise():
+    import pytest
+
+    from ads.core.rules.exceptions import RuleParameterError
+    from ads.plugins.rules.greater_than_rule import GreaterThan
+
+    with pytest.raises(RuleParameterError) as error:
+        GreaterThan().render(helpers=None, extra_params={"check_name": "c", "suite_name": "s", "column_name": None})
+    assert error.value.missing_params == ["column_name", "lower_limit_value"]
+
+
+def test_rendered_sql_is_memoized_per_params():
+    from ads.core.rules import rule_template_base
+    from ads.core.rules.builtin.accepted_values_rule import AcceptedValuesRule
+
+    params = {"check_name": "c", "suite_name": "s", "column_name": "status"}
+    rule = AcceptedValuesRule(params={"accepted_values": ["'A'", "'B'"]})
+
+    first = rule.render(helpers=None, extra_params=params)
+    hits = rule_template_base._render_cached.cache_info().hits
+    assert rule.render(helpers=None, extra_params=dict(params)) == first
+    assert rule_template_base._render_cached.cache_info().hits == hits + 1
+    assert "NOT IN ('A', 'B')" in first
+
+    # Equal but differently typed values must not share a rendered SQL
+    assert "(1)" in AcceptedValuesRule(params={"accepted_values": [1]}).render(helpers=None, extra_params=params)
+    assert "(True)" in AcceptedValuesRule(params={"accepted_values": [True]}).render(helpers=None, extra_params=params)
+
+
+def test_core_rules_are_shared_instances():
+    registry = RulesetRegistry()
+    assert registry.core.not_null is RulesetRegistry().core.not_null
+    assert registry.get("unique") is registry.core.unique
+
+    # Shared instances cannot be changed in place
+    with pytest.raises(TypeError):
+        registry.core.not_null.params["column_name"] = "order_id"
+    with pytest.raises(TypeError):
+        registry.core.unique.params.update(column_name="order_id")
+    assert registry.core.not_null.params == {}
+
+    accepted_values = registry.core.accepted_values(accepted_values=["'A'"])
+    assert accepted_values.params == {"accepted_values": ["'A'"]}
+    assert accepted_values is not registry.core.accepted_values(accepted_values=["'A'"])
+
+
+def test_duplicate_rows_compares_key_columns_as_struct():
+    registry = RulesetRegistry()
+    rule = registry.core.duplicated_rows(column_names=["order_id", "order_date"])
+
+    sql = rule.render(helpers=None, extra_params={"check_name": "dupes", "suite_name": "orders_suite"})
+    assert "COUNT(*) - COUNT(DISTINCT STRUCT(order_id, order_date)) AS value" in sql
+    assert rule.required_params == ["column_names"]
+
+
+def test_plugin_rules_from_entry_points(monkeypatch):
+    import importlib.metadata
+
+    from ads.core.rules.plugin_ruleset_registry import PluginRulesetRegistry
+    from ads.plugins.rules.greater_than_rule import GreaterThan
+
+    entry_point = importlib.metadata.EntryPoint(name="greater_than",
+                                                value="ads.plugins.rules.greater_than_rule:GreaterThan",
+                                                group=PluginRulesetRegistry.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [entry_point])
+    monkeypatch.setattr(PluginRulesetRegistry, "_load_builtin_rules", lambda self: pytest.fail("filesystem scan"))
+
+    assert PluginRulesetRegistry().list() == {"greater_than": GreaterThan}
+
+
+def test_plugin_rules_filesystem_fallback(monkeypatch):
+    import importlib.metadata
+
+    from ads.core.rules.plugin_ruleset_registry import PluginRulesetRegistry
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [])
+    assert "greater_than" in PluginRulesetRegistry().list()
+
+
+def test_registry_get_resolves_core_and_plugin_rules():
+    registry = RulesetRegistry()
+    assert registry.get("not_null") is registry.core.not_null
+    assert registry.get("duplicate_rows") == registry.get("duplicated_rows")
+    assert "greater_than" in registry.plugins
+    assert registry.get("greater_than").name == "greater_than"
+    with pytest.raises(KeyError):
+        registry.get("__init__")
+
+
+def test_accepted_values_uses_unnest_for_large_lists():
+    from ads.core.rules.builtin.accepted_values_rule import AcceptedValuesRule
+
+    params = {"check_name": "c", "suite_name": "s", "column_name": "code"}
+    small = AcceptedValuesRule(params={"accepted_values": list(range(15))}).render(helpers=None, extra_params=params)
+    large = AcceptedValuesRule(params={"accepted_values": list(range(16))}).render(helpers=None, extra_params=params)
+
+    assert "NOT IN (0, 1," in small and "UNNEST" not in small
+    assert "COUNTIF(code NOT IN UNNEST([0, 1, 2," in large and "15]))" in large
+
+
+def test_falsy_required_params_are_valid():
+    from ads.core.rules.builtin.value_range_rule import ValueRangeRule
+
+    rule = ValueRangeRule(params={"lower_bound": 0, "upper_bound": 10})
+    sql = rule.render(helpers=None, extra_params={"check_name": "c", "suite_name": "s", "column_name": "amount"})
+    assert "amount < 0" in sql
+
+
+def test_rule_template_block_tags_do_not_leak_whitespace():
+    from ads.core.rules import rule_template_base
+
+    template = rule_template_base._compile_sql_template("SELECT\n  {% if flag %}\n  1\n  {% endif %}\n")
+    assert template.render(flag=True) == "SELECT\n  1\n"
+
+
+def test_substitution_only_templates_render_like_jinja():
+    from ads.core.rules import rule_template_base
+    from ads.core.rules.builtin.freshness_rule import FreshnessRule
+    from ads.core.rules.builtin.not_null_rule import NotNullRule
+    from ads.plugins.rules.greater_than_rule import GreaterThan
+
+    params = {"check_name": "c", "suite_name": "s", "column_name": "amount", "lower_limit_value": 0,
+              "granularity": "HOUR"}
+    for rule_cls in (NotNullRule, FreshnessRule, GreaterThan):
+        assert isinstance(rule_cls._compiled_template, rule_template_base._FormatTemplate)
+        expected = rule_template_base._JINJA_ENV.from_string(rule_cls.sql_template).render(params)
+        assert rule_cls._compiled_template.render(params) == expected
+
+    template = rule_template_base._FormatTemplate.from_source("STRUCT<a INT64>{ {{ x }} }\n")
+    assert template.render({"x": "{y}"}) == "STRUCT<a INT64>{ {y} }"
+    assert rule_template_base._FormatTemplate.from_source("{{ x | upper }}") is None
+    assert rule_template_base._FormatTemplate.from_source("{% if x %}1{% endif %}") is None
+
+
+def test_generated_render_functions_keep_literal_text_and_report_missing_params():
+    import jinja2
+    import pytest
+    from ads.core.rules import rule_template_base
+
+    source = "SELECT '{{ a }}' AS q, \"x\\n\" AS b, r'''{{ a }}{{ b }}'''\n"
+    template = rule_template_base._FormatTemplate.from_source(source)
+    params = {"a": "it's", "b": 1.5, "unused": object()}
+    assert template.render(params) == rule_template_base._JINJA_ENV.from_string(source).render(params)
+
+    with pytest.raises(jinja2.UndefinedError, match="'b' is undefined"):
+        template.render({"a": 1})
+    assert rule_template_base._FormatTemplate.from_source("{{ class }}") is None
@@ -0,0 +1,200 @@
+import pytest
+
+from ads.core.enums import SuiteRunStatus
+from ads.core.models import ResultsMetadata
+from ads.core.runner.sentinel_runner import SentinelRunner
+
+
+def test_merge_batch_metadata():
+    metadata = ResultsMetadata(suite_name="orders_suite", job_id="job_1", status=SuiteRunStatus.SUCCESS,
+                               duration_ms=10, bytes_processed=100, cache_hit=True, ended_at=1.0)
+    batch_metadata = ResultsMetadata(suite_name="orders_suite", job_id="job_2", status=SuiteRunStatus.FAILED,
+                                     duration_ms=5, bytes_processed=50, cache_hit=False, ended_at=2.0, errors=["boom"])
+
+    SentinelRunner._merge_batch_metadata(metadata=metadata, batch_metadata=batch_metadata)
+
+    assert metadata.status == SuiteRunStatus.FAILED
+    assert (metadata.duration_ms, metadata.bytes_processed, metadata.cache_hit, metadata.ended_at) == (15, 150, False, 2.0)
+    assert metadata.errors == ["boom"]
+    assert metadata.extra["batch_job_ids"] == ["job_1", "job_2"]
+
+
+def test_runner_components_share_the_global_helpers():
+    from ads.helpers.helper_library import HelperLibrary
+
+    runner = SentinelRunner(project_id="test-project")
+
+    assert runner.helpers is HelperLibrary.global_instance()
+    assert runner.helpers is SentinelRunner(project_id="other-project").helpers
+
+
+def test_suite_sql_is_compiled_once_per_fingerprint(monkeypatch):
+    from ads.core.engine.sql_builder import SQLBuilder
+    from ads.core.models import Check, DataSource, DataSourceType, Suite
+    from ads.core.rules.core_ruleset_registry import core_ruleset
+
+    def build_suite(column_name):
+        return Suite(name="orders_suite",
+                     data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"),
+                     checks=[Check(name="null_check", rule_template=core_ruleset.not_null, column_name=column_name)])
+
+    builds = []
+    original_build_batches = SQLBuilder.build_batches
+    monkeypatch.setattr(SQLBuilder, "build_batches", lambda self: builds.append(1) or original_build_batches(self))
+    runner = SentinelRunner(project_id="test-project")
+
+    first = runner._build_sql_batches(suite=build_suite("customer_id"))
+    assert runner._build_sql_batches(suite=build_suite("customer_id")) is first
+    assert len(builds) == 1
+
+    assert "order_id IS NULL" in runner._build_sql_batches(suite=build_suite("order_id"))[0]
+    assert len(builds) == 2
+
+    runner.clear_sql_cache()
+    runner._build_sql_batches(suite=build_suite("customer_id"))
+    assert len(builds) == 3
+
+
+def test_suite_fingerprint_depends_on_rule_class():
+    from ads.core.models import Check, DataSource, Suite
+    from ads.core.rules.core_ruleset_registry import core_ruleset
+
+    def build_suite(rule_template):
+        return Suite(name="s", data_source=DataSource(table="t"),
+                     checks=[Check(name="c", rule_template=rule_template, column_name="x")])
+
+    assert build_suite(core_ruleset.not_null).fingerprint() == build_suite(core_ruleset.not_null).fingerprint()
+    assert build_suite(core_ruleset.not_null).fingerprint() != build_suite(core_ruleset.unique).fingerprint()
+
+
+def test_validate_only_skips_result_parsing(monkeypatch):
+    from ads.core.models import Check, DataSource, Suite
+    from ads.core.rules.core_ruleset_registry import core_ruleset
+
+    suite = Suite(name="s", data_source=DataSource(table="t"),
+                  checks=[Check(name="c", rule_template=core_ruleset.row_count)])
+    runner = SentinelRunner(project_id="test-project")
+    validated = ResultsMetadata(suite_name="s", status=SuiteRunStatus.VALIDATION_SUCCESS)
+    monkeypatch.setattr(type(runner.executor), "execute", lambda self, **kwargs: (validated, []))
+    monkeypatch.setattr(type(runner._result_parser), "parse", lambda self, **kwargs: pytest.fail("parsed a dry-run"))
+
+    assert runner.run_suite(suite=suite, validate_only=True) == (validated, [])
+
+
+def test_executor_is_created_on_first_use():
+    from ads.core.engine.executor import Executor
+
+    runner = SentinelRunner(project_id="test-project", location="EU")
+
+    assert runner._executor is None
+    assert isinstance(runner.executor, Executor) and runner.executor is runner.executor
+    assert repr(runner) == "<SentinelRunner project='test-project' location='EU'>"
+
+
+def test_parallel_validate_reports_every_invalid_check(monkeypatch):
+    from ads.core.engine.executor import Executor
+    from ads.core.models import Check, DataSource, Suite
+    from ads.core.rules.core_ruleset_registry import core_ruleset
+
+    suite = Suite(name="s", data_source=DataSource(table="t"), checks=[
+        Check(name="bad_a", rule_template=core_ruleset.not_null, column_name="missing_a"),
+        Check(name="good", rule_template=core_ruleset.row_count),
+        Check(name="bad_b", rule_template=core_ruleset.not_null, column_name="missing_b"),
+    ])
+
+    def dry_run(self, sql_query):
+        if "missing_" in sql_query:
+            raise ValueError("Unrecognized name")
+        return {}
+
+    monkeypatch.setattr(Executor, "dry_run", dry_run)
+    monkeypatch.setattr(Executor, "execute", lambda self, **kwargs: pytest.fail("executed an invalid suite"))
+
+    metadata, results = SentinelRunner(project_id="test-project").run_suite(suite=suite, parallel_validate=True)
+
+    assert results == []
+    assert metadata.status == SuiteRunStatus.VALIDATION_FAILED
+    assert metadata.errors == ["bad_a: Unrecognized name", "bad_b: Unrecognized name"]
+
+
+def test_run_suites_combines_suites_into_one_job(monkeypatch):
+    from ads.core.engine.executor import Executor
+    from ads.core.models import Check, DataSource, Suite
+    from ads.core.rules.core_ruleset_registry import core_ruleset
+
+    suites = [
+        Suite(name=name, data_source=DataSource(table=f"project.dataset.{name}"),
+              checks=[Check(name="row_count_check", rule_template=core_ruleset.row_count)])
+        for name in ("orders", "customers")
+    ]
+    queries = []
+
+    def execute(self, suite, sql_query, **kwargs):
+        queries.append(sql_query)
+        rows = [{"suite_name": "customers", "check_name": "row_count_check", "value": 2},
+                {"suite_name": "orders", "check_name": "row_count_check", "value": 1}]
+        return ResultsMetadata(suite_name=suite.name, job_id="job_1", status=SuiteRunStatus.SUCCESS), iter(rows)
+
+    monkeypatch.setattr(Executor, "execute", execute)
+
+    outcomes = SentinelRunner(project_id="test-project").run_suites(suites=suites)
+
+    assert len(queries) == 1
+    assert "SELECT 'orders' AS suite_name" in queries[0] and "SELECT 'customers' AS suite_name" in queries[0]
+    assert [(metadata.suite_name, metadata.job_id) for metadata, _ in outcomes] == [("orders", "job_1"), ("customers", "job_1")]
+    assert [[r.value for r in results] for _, results in outcomes] == [[1.0], [2.0]]
+    assert outcomes[0][0].extra["batched_suites"] == ["orders", "customers"]
+
+    with pytest.raises(ValueError):
+        SentinelRunner(project_id="test-project").run_suites(suites=[suites[0], suites[0]])
+
+
+def test_run_suites_compiles_a_suite_run_alone_once(monkeypatch):
+    from ads.core.engine.executor import Executor
+    from ads.core.engine.sql_builder import SQLBuilder
+    from ads.core.models import Check, DataSource, Suite
+    from ads.core.rules.core_ruleset_registry import core_ruleset
+
+    suite = Suite(name="orders", data_source=DataSource(table="project.dataset.orders"),
+                  checks=[Check(name="row_count_check", rule_template=core_ruleset.row_count)])
+    builds = []
+    original_build_batches = SQLBuilder.build_batches
+    monkeypatch.setattr(SQLBuilder, "build_batches", lambda self: builds.append(1) or original_build_batches(self))
+    monkeypatch.setattr(SQLBuilder, "build_as_subquery", lambda self: pytest.fail("built a subquery for a suite run alone"))
+    monkeypatch.setattr(Executor, "execute", lambda self, suite, sql_query, **kwargs: (
+        ResultsMetadata(suite_name=suite.name, status=SuiteRunStatus.SUCCESS),
+        iter([{"check_name": "row_count_check", "value": 1}])
+    ))
+
+    [(metadata, results)] = SentinelRunner(project_id="test-project").run_suites(suites=[suite])
+
+    assert len(builds) == 1
+    assert [r.value for r in results] == [1.0]
+
+
+@pytest.mark.parametrize("validate_first, expected_dry_runs", [(True, 2), (False, 0)])
+def test_parallel_validate_follows_validate_first(monkeypatch, validate_first, expected_dry_runs):
+    from ads.core.engine.executor import Executor
+    from ads.core.models import Check, DataSource, Suite
+    from ads.core.rules.core_ruleset_registry import core_ruleset
+
+    suite = Suite(name="s", data_source=DataSource(table="t"), checks=[
+        Check(name="null_check", rule_template=core_ruleset.not_null, column_name="customer_id"),
+        Check(name="row_count_check", rule_template=core_ruleset.row_count),
+    ])
+    dry_runs, executions = [], []
+
+    def execute(self, suite, sql_query, **kwargs):
+        executions.append(kwargs)
+        return ResultsMetadata(suite_name=suite.name, status=SuiteRunStatus.SUCCESS), iter(())
+
+    monkeypatch.setattr(Executor, "dry_run", lambda self, sql_query: dry_runs.append(sql_query) or {})
+    monkeypatch.setattr(Executor, "execute", execute)
+
+    metadata, _ = SentinelRunner(project_id="test-project").run_suite(suite=suite,
+                                                                      validate_first=validate_first,
+                                                                      parallel_validate=True)
+
+    assert metadata.status == SuiteRunStatus.SUCCESS
+    assert len(dry_runs) == expected_dry_runs
+    assert [kwargs["validate_first"] for kwargs in executions] == [validate_first]
@@ -0,0 +1,126 @@
+from ads.core.engine.sql_builder import SQLBuilder
+from ads.core.models import Check, DataSource, DataSourceType, Suite
+from ads.core.rules.core_ruleset_registry import core_ruleset
+from ads.helpers.helper_library import HelperLibrary
+
+
+def _build_suite(params=None) -> Suite:
+    return Suite(
+        name="orders_suite",
+        data_source=DataSource(type=DataSourceType.QUERY, query="SELECT * FROM project.dataset.orders WHERE ymd = '{{ ymd }}'"),
+        params=params,
+        checks=[
+            Check(name="row_count_check", rule_template=core_ruleset.row_count),
+            Check(name="customer_id_null_check", rule_template=core_ruleset.not_null, column_name="customer_id"),
+        ]
+    )
+
+
+def test_build_suite_sql():
+    sql = SQLBuilder(suite=_build_suite(params={"ymd": "2025-11-02"}), helpers=HelperLibrary()).build()
+
+    assert "WITH cte_orders_suite_base AS" in sql
+    assert "WHERE ymd = '2025-11-02'" in sql
+    assert "cte_row_count_check AS (" in sql
+    assert "COUNTIF(customer_id IS NULL) AS value" in sql
+    assert "SELECT * FROM cte_row_count_check\nUNION ALL\nSELECT * FROM cte_customer_id_null_check" in sql
+    assert "{{" not in sql
+
+
+def test_build_suite_sql_without_params():
+    sql = SQLBuilder(suite=_build_suite(), helpers=HelperLibrary()).build()
+
+    assert "WHERE ymd = '{{ ymd }}'" in sql
+    assert "SELECT * FROM cte_customer_id_null_check" in sql
+
+
+def test_build_batches():
+    builder = SQLBuilder(suite=_build_suite(params={"ymd": "2025-11-02"}), helpers=HelperLibrary())
+
+    assert builder.build_batches() == [builder.build()]
+
+    batches = builder.build_batches(max_query_length=1)
+    assert len(batches) == 2
+    assert all("WITH cte_orders_suite_base AS" in sql for sql in batches)
+    assert batches[0].endswith("SELECT * FROM cte_row_count_check")
+    assert batches[1].endswith("SELECT * FROM cte_customer_id_null_check")
+    assert "cte_customer_id_null_check" not in batches[0]
+
+
+def test_aggregate_checks_are_fused_into_one_scan():
+    suite = Suite(
+        name="orders_suite",
+        data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"),
+        checks=[
+            Check(name="row_count_check", rule_template=core_ruleset.row_count),
+            Check(name="customer_id_null_check", rule_template=core_ruleset.not_null, column_name="customer_id"),
+            Check(name="revenue_negative_check", rule_template=core_ruleset.negative_values, column_name="revenue"),
+        ]
+    )
+    sql = SQLBuilder(suite=suite, helpers=HelperLibrary()).build()
+
+    assert sql.count("cte_orders_suite_base") == 3  # definition, row count CTE and fused CTE
+    assert "-- customer_id_null_check\n            COUNTIF(customer_id IS NULL) AS value_0,\n" in sql
+    assert "-- revenue_negative_check\n            COUNTIF(revenue < 0) AS value_1\n" in sql
+    assert "STRUCT('revenue_negative_check' AS check_name, CAST(aggregates.value_1 AS FLOAT64) AS value)" in sql
+    assert sql.endswith("SELECT * FROM cte_row_count_check\nUNION ALL\nSELECT * FROM fused_orders_suite_checks")
+    assert "cte_customer_id_null_check" not in sql
+
+
+def test_fused_cte_name_does_not_collide_with_check_ctes():
+    import re
+
+    suite = Suite(
+        name="orders",
+        data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"),
+        checks=[
+            Check(name="orders_fused", rule_template=core_ruleset.row_count),
+            Check(name="orders_checks", rule_template=core_ruleset.row_count),
+            Check(name="customer_id_null_check", rule_template=core_ruleset.not_null, column_name="customer_id"),
+            Check(name="revenue_negative_check", rule_template=core_ruleset.negative_values, column_name="revenue"),
+        ]
+    )
+    sql = SQLBuilder(suite=suite, helpers=HelperLibrary()).build()
+
+    cte_names = re.findall(r"^(\w+) AS \(", sql, flags=re.MULTILINE)
+    assert len(cte_names) == len(set(cte_names))
+
+
+def test_regex_checks_on_one_column_share_a_scan():
+    suite = Suite(
+        name="orders_suite",
+        data_source=DataSource(type=DataSourceType.TABLE, table="project.dataset.orders"),
+        checks=[
+            Check(name="code_upper_check", rule_template=core_ruleset.regex_match(regex_pattern="^[A-Z]+$"), column_name="code"),
+            Check(name="code_length_check", rule_template=core_ruleset.regex_match(regex_pattern="^.{3}$"), column_name="code"),
+        ]
+    )
+    sql = SQLBuilder(suite=suite, helpers=HelperLibrary()).build()
+
+    assert "COUNTIF(NOT REGEXP_CONTAINS(code, r'^[A-Z]+$')) AS value_0" in sql
+    assert "COUNTIF(NOT REGEXP_CONTAINS(code, r'^.{3}$')) AS value_1" in sql
+    assert sql.count("FROM cte_orders_suite_base") == 1
+
+
+def test_build_check_statements():
+    statements = SQLBuilder(suite=_build_suite(params={"ymd": "2025-11-02"}), helpers=HelperLibrary()).build_check_statements()
+
+    assert list(statements) == ["row_count_check", "customer_id_null_check"]
+    assert all("WHERE ymd = '2025-11-02'" in sql for sql in statements.values())
+    assert statements["customer_id_null_check"].endswith("SELECT * FROM cte_customer_id_null_check")
+    assert "cte_row_count_check" not in statements["customer_id_null_check"]
+
+
+def test_build_as_subquery():
+    builder = SQLBuilder(suite=_build_suite(params={"ymd": "2025-11-02"}), helpers=HelperLibrary())
+
+    sql = builder.build_as_subquery()
+
+    assert sql.startswith("SELECT 'orders_suite' AS suite_name, suite_checks.*\nFROM (\n-- Base CTE")
+    assert sql.endswith(f"{builder.build()}\n) AS suite_checks")
+
+
+def test_wrap_as_subquery_escapes_suite_name():
+    sql = SQLBuilder.wrap_as_subquery(suite_name="o'rders\\", sql_query="SELECT 1")
+
+    assert sql.startswith("SELECT 'o\\'rders\\\\' AS suite_name, suite_checks.*\n")
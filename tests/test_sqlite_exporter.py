@@ -0,0 +1,35 @@
+import json
+import sqlite3
+
+from ads.core.enums import CheckStatus, Severity, SuiteRunStatus
+from ads.core.exporters.sqlite_exporter import SQLiteExporter
+from ads.core.models import Result, ResultsMetadata
+
+
+def test_sqlite_export(tmp_path, monkeypatch):
+    # Templates must resolve relative to the package, not the working directory
+    monkeypatch.chdir(tmp_path)
+
+    exporter = SQLiteExporter()
+    metadata = ResultsMetadata(job_id="job_001", suite_name="sales_suite", status=SuiteRunStatus.SUCCESS,
+                               errors=["first error"])
+    results = [
+        Result(check_name="null_check", status=CheckStatus.PASS, severity=Severity.INFO, value=0.0),
+        Result(check_name="unique_check", status=CheckStatus.FAIL, severity=Severity.CRITICAL, value=12,
+               check_params={"column_name": "order_id"}, message="Duplicates found"),
+    ]
+
+    db_file = tmp_path / "db" / "ads.db"
+    for _ in range(2):
+        exporter.export(metadata=metadata, results=results, destination=str(db_file))
+
+    with sqlite3.connect(db_file) as conn:
+        runs = conn.execute("SELECT id, job_id, status, error_count, created_at FROM ads_runs").fetchall()
+        rows = conn.execute("SELECT run_id, check_name, check_params, status, severity FROM ads_results "
+                            "ORDER BY id").fetchall()
+
+    assert [r[1:4] for r in runs] == [("job_001", "SUCCESS", 1)] * 2
+    assert all(r[4] is not None for r in runs)
+    assert len(rows) == 4
+    assert rows[1][:2] + rows[1][3:] == (runs[0][0], "unique_check", "FAIL", "CRITICAL")
+    assert json.loads(rows[1][2]) == {"column_name": "order_id"}
@@ -0,0 +1,55 @@
+import jinja2
+import pytest
+
+from ads.helpers.string_helper import StringHelper
+
+
+def test_render_jinja_template_undefined_modes():
+    assert StringHelper.render_jinja_template("{{ a }}-{{ b }}", {"a": 1}, keep_undefined_as_is=True) == "1-{{ b }}"
+    with pytest.raises(jinja2.UndefinedError):
+        StringHelper.render_jinja_template("{{ a }}-{{ b }}", {"a": 1})
+    assert StringHelper.render_jinja_template("{{ a }}", {"a": 2}) == "2"
+
+
+def test_render_jinja_template_compiles_each_source_once():
+    from ads.helpers import string_helper
+
+    StringHelper.render_jinja_template("SELECT {{ x }}", {"x": 1})
+    misses = string_helper._compile_template.cache_info().misses
+    assert StringHelper.render_jinja_template("SELECT {{ x }}", {"x": 2}) == "SELECT 2"
+    assert string_helper._compile_template.cache_info().misses == misses
+
+
+def test_compile_template_source_reuses_on_disk_bytecode(tmp_path, monkeypatch):
+    from ads.helpers.string_helper import compile_template_source
+
+    def new_env():
+        return jinja2.Environment(bytecode_cache=jinja2.FileSystemBytecodeCache(directory=str(tmp_path)))
+
+    assert compile_template_source(env=new_env(), source="SELECT {{ x }}", namespace="test").render(x=1) == "SELECT 1"
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # A fresh environment (e.g. the next process) loads the bytecode instead of compiling
+    env = new_env()
+    monkeypatch.setattr(env, "compile", lambda *args, **kwargs: pytest.fail("template compiled again"))
+    assert compile_template_source(env=env, source="SELECT {{ x }}", namespace="test").render(x=2) == "SELECT 2"
+
+
+def test_bytecode_cache_is_resolved_lazily_and_failures_disable_it(monkeypatch):
+    from pathlib import Path
+
+    from ads.helpers import string_helper
+
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv(string_helper.BYTECODE_CACHE_DIR_ENV, raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    string_helper._build_bytecode_cache.cache_clear()
+    try:
+        assert string_helper._build_bytecode_cache() is None
+        env = jinja2.Environment(bytecode_cache=string_helper.BYTECODE_CACHE)
+        template = string_helper.compile_template_source(env=env, source="SELECT {{ x }}", namespace="test_no_home")
+        assert template.render(x=1) == "SELECT 1"
+    finally:
+        string_helper._build_bytecode_cache.cache_clear()